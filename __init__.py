@@ -11,17 +11,23 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
-from .coordinator import NatureRemoCoordinator
-
-# from .services import NatureRemoServicesSetup
+from .coordinator import STORAGE_VERSION, NatureRemoCoordinator, snapshot_storage_key
+from .services import NatureRemoServicesSetup
+from .shared_client import async_release_client
 
 _LOGGER = logging.getLogger(__name__)
 
-# For your initial PR, limit it to 1 platform.
-PLATFORMS: list[Platform] = [Platform.CLIMATE]
+PLATFORMS: list[Platform] = [
+    Platform.BUTTON,
+    Platform.CLIMATE,
+    Platform.LIGHT,
+    Platform.MEDIA_PLAYER,
+    Platform.SENSOR,
+]
 
 
 @dataclass
@@ -45,10 +51,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     # ----------------------------------------------------------------------------
     # Perform an initial data load from api.
+    # If a snapshot from a previous run exists, entities are created from it
+    # straight away and the first refresh runs in the background instead.
     # async_config_entry_first_refresh() is special in that it does not log errors
     # if it fails.
     # ----------------------------------------------------------------------------
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        restored = await coordinator.async_load_snapshot()
+        if not restored:
+            await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await async_release_client(hass, coordinator.client)
+        raise
 
     # ----------------------------------------------------------------------------
     # Test to see if api initialised correctly, else raise ConfigNotReady to make
@@ -57,6 +71,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # update.
     # ----------------------------------------------------------------------------
     if not coordinator.data:
+        await async_release_client(hass, coordinator.client)
         raise ConfigEntryNotReady
 
     # ----------------------------------------------------------------------------
@@ -88,12 +103,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             hass.config_entries.async_forward_entry_setup(config_entry, platform)
         )
 
+    if restored:
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+
     # ----------------------------------------------------------------------------
     # Setup global services
     # This can be done here but included in a seperate file for ease of reading.
     # See also switch.py for entity services examples
     # ----------------------------------------------------------------------------
-    # NatureRemoServicesSetup(hass, config_entry)
+    NatureRemoServicesSetup(hass, config_entry)
 
     # Return true to denote a successful setup.
     return True
@@ -102,10 +122,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle config options update.
 
-    Reload the integration when the options change.
+    Options are applied to the running coordinator, e.g. a local host found
+    by zeroconf, and the integration is only reloaded when one cannot be.
     Called from our listener created above.
     """
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    runtime_data: RuntimeData = hass.data[DOMAIN][config_entry.entry_id]
+    if not runtime_data.coordinator.async_apply_options(config_entry.options):
+        await hass.config_entries.async_reload(config_entry.entry_id)
 
 
 async def async_remove_config_entry_device(
@@ -120,6 +143,13 @@ async def async_remove_config_entry_device(
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot when the config entry is deleted."""
+    await Store(
+        hass, STORAGE_VERSION, snapshot_storage_key(config_entry.entry_id)
+    ).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry.
 
@@ -127,18 +157,23 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     If you have created any custom services, they need to be removed here too.
     """
 
-    # Unload services
-    for service in hass.services.async_services_for_domain(DOMAIN):
-        hass.services.async_remove(DOMAIN, service)
-
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     )
 
-    # Remove the config entry from the hass data object.
+    # Remove the config entry from the hass data object, drop its pending
+    # commands and release the shared api client, which closes its pooled
+    # connections once no entry uses it.
     if unload_ok:
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        runtime_data: RuntimeData = hass.data[DOMAIN].pop(config_entry.entry_id)
+        await runtime_data.coordinator.async_shutdown()
+        await async_release_client(hass, runtime_data.coordinator.client)
+
+        # Unload services once no entry is left to serve
+        if not hass.data[DOMAIN]:
+            for service in hass.services.async_services_for_domain(DOMAIN):
+                hass.services.async_remove(DOMAIN, service)
 
     # Return that unloading was successful.
     return unload_ok
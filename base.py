@@ -11,15 +11,16 @@ and what additional properties and methods you need to add for each entity type.
 """
 
 import logging
-from typing import Any
 
 from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import NatureRemoCoordinator
+from .models import Appliance, Device
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,24 +47,21 @@ class NatureRemoBaseEntity(CoordinatorEntity):
     _attr_has_entity_name = True
 
     def __init__(
-        self, coordinator: NatureRemoCoordinator, device: dict[str, Any], parameter: str
+        self, coordinator: NatureRemoCoordinator, device: Device, parameter: str
     ) -> None:
         """Initialise entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({("devices", device.id)}))
         self.device = device
-        self.device_id = device["device_id"]
+        self.device_id = device.id
         self.parameter = parameter
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
         # This method is called by your DataUpdateCoordinator when a successful update runs.
-        self.device = self.coordinator.get_device(self.device_id)
-        _LOGGER.debug(
-            "Updating device: %s, %s",
-            self.device_id,
-            self.coordinator.get_device_parameter(self.device_id, "device_name"),
-        )
+        if device := self.coordinator.get_device(self.device_id):
+            self.device = device
+        _LOGGER.debug("Updating device: %s, %s", self.device_id, self.device.name)
         self.async_write_ha_state()
 
     @property
@@ -81,22 +79,11 @@ class NatureRemoBaseEntity(CoordinatorEntity):
         # and a device uuid, mac address or some other unique attribute.
         # ----------------------------------------------------------------------------
         return DeviceInfo(
-            name=self.coordinator.get_device_parameter(self.device_id, "device_name"),
-            manufacturer="ACME Manufacturer",
-            model=str(
-                self.coordinator.get_device_parameter(self.device_id, "device_type")
-            )
-            .replace("_", " ")
-            .title(),
-            sw_version=self.coordinator.get_device_parameter(
-                self.device_id, "software_version"
-            ),
-            identifiers={
-                (
-                    DOMAIN,
-                    self.coordinator.get_device_parameter(self.device_id, "device_uid"),
-                )
-            },
+            name=self.device.name,
+            manufacturer="Nature Remo",
+            model=self.device.serial_number,
+            sw_version=self.device.firmware_version,
+            identifiers={(DOMAIN, self.device_id)},
         )
 
     @property
@@ -134,18 +121,19 @@ class NatureRemoBaseEntity(CoordinatorEntity):
         #
         # This is even more important if your integration supports multiple instances.
         # ----------------------------------------------------------------------------
-        return f"{DOMAIN}-{self.coordinator.get_device_parameter(self.device_id, "device_uid")}-{self.parameter}"
+        return f"{DOMAIN}-{self.device_id}-{self.parameter}"
 
 
 class NatureRemoBase(Entity):
     """Nature Remo entity base class."""
 
-    def __init__(self, coordinator, appliance) -> None:
+    def __init__(self, coordinator, appliance: Appliance) -> None:
         """Init the thing."""
         self._coordinator = coordinator
-        self._name = f"Nature Remo {appliance['nickname']}"
-        self._appliance_id = appliance["id"]
-        self._device = appliance["device"]
+        self._name = f"Nature Remo {appliance.nickname}"
+        self._appliance_id = appliance.id
+        self._device = appliance.device
+        self._removing = False
 
     @property
     def name(self):
@@ -162,14 +150,45 @@ class NatureRemoBase(Entity):
         """Return the polling requirement of the entity."""
         return False
 
+    @property
+    def update_context(self) -> frozenset[tuple[str, str]]:
+        """Return the coordinator keys whose changes this entity follows."""
+        return frozenset(
+            {("appliances", self._appliance_id), ("devices", self._device.id)}
+        )
+
+    @callback
+    def _async_remove_if_gone(self) -> None:
+        """Remove the entity once its appliance is gone from the account.
+
+        An appliance missing from the data may only have failed to parse, so
+        the entity, and the user's customizations in its registry entry, are
+        kept until the coordinator has confirmed it is gone.
+        """
+        if self._coordinator.is_appliance_gone(self._appliance_id):
+            self._async_remove()
+
+    @callback
+    def _async_remove(self) -> None:
+        """Remove the entity and its registry entry."""
+        if self._removing:
+            return
+        self._removing = True
+        _LOGGER.debug("Removing %s, it is no longer reported", self.entity_id)
+        if self.registry_entry is not None:
+            # The entity removes itself when its registry entry is removed.
+            er.async_get(self.hass).async_remove(self.entity_id)
+        else:
+            self.hass.async_create_task(self.async_remove(force_remove=True))
+
     @property
     def device_info(self):
         """Return the device info for the sensor."""
         # Since device registration requires Config Entries, this dosen't work for now
         return {
-            "identifiers": {(DOMAIN, self._device["id"])},
-            "name": self._device["name"],
+            "identifiers": {(DOMAIN, self._device.id)},
+            "name": self._device.name,
             "manufacturer": "Nature Remo",
-            "model": self._device["serial_number"],
-            "sw_version": self._device["firmware_version"],
+            "model": self._device.serial_number,
+            "sw_version": self._device.firmware_version,
         }
@@ -0,0 +1,80 @@
+"""Benchmark NatureRemoAPI.get against a local stub with artificial latency.
+
+Compares fetching /appliances and /devices one after the other with the
+concurrent NatureRemoAPI.get. Run from the repository root:
+
+    python bench/bench_api_latency.py [--delay 0.1] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from aiohttp import web
+
+from common import fake_appliances, fake_devices, load
+
+api_module = load("nature_remo_api")
+
+
+async def start_stub(delay: float) -> tuple[web.AppRunner, str]:
+    """Serve fake /appliances and /devices, each answering after delay."""
+    bodies = {
+        "/appliances": json.dumps(fake_appliances(50)).encode(),
+        "/devices": json.dumps(fake_devices(10)).encode(),
+    }
+
+    async def handle(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        return web.Response(body=bodies[request.path], content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/appliances", handle)
+    app.router.add_get("/devices", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def measure(fetch, rounds: int) -> list[float]:
+    """Return the wall time of each round in milliseconds."""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await fetch()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+async def main(delay: float, rounds: int) -> None:
+    runner, host = await start_stub(delay)
+    api = api_module.NatureRemoAPI(host, "token")
+
+    async def sequential() -> None:
+        await api.get_appliances()
+        await api.get_devices()
+
+    try:
+        await api.get()  # open the pooled connections
+        for name, fetch in (("sequential", sequential), ("concurrent get()", api.get)):
+            times = await measure(fetch, rounds)
+            print(
+                f"{name:>17}: mean {statistics.mean(times):7.1f} ms"
+                f"  max {max(times):7.1f} ms"
+            )
+    finally:
+        await api.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=0.1, help="stub latency (s)")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.delay, args.rounds))
@@ -0,0 +1,78 @@
+"""Benchmark the climate capability reads of one AC state write.
+
+Compares deriving min/max temperature, step, HVAC, fan and swing modes
+from the raw aircon range on every read, as before they were cached, with
+reading the capabilities NatureRemoAC caches per range. Needs Home
+Assistant installed, like the climate platform. Run from the repository
+root:
+
+    python bench/bench_climate_state.py
+"""
+
+from common import best_of, fake_appliances, load
+
+climate = load("climate")
+models = load("models")
+
+HVAC_OFF = climate.climate.HVACMode.OFF
+
+
+def temp_range(modes: dict, mode: str) -> list[float]:
+    """Parse a mode's temperatures, as _current_mode_temp_range did."""
+    return list(map(float, filter(None, modes[mode]["temp"])))
+
+
+def read_uncached(modes: dict, mode: str) -> tuple:
+    """Read the capabilities the way the properties used to derive them.
+
+    The raw string temperatures were parsed on each of the three reads
+    that need them.
+    """
+    temps = temp_range(modes, mode)
+    min_temp = min(temps) if temps else 0
+    temps = temp_range(modes, mode)
+    max_temp = max(temps) if temps else 0
+    temps = temp_range(modes, mode)
+    step = 1
+    if len(temps) >= 2 and round(temps[1] - temps[0], 1) in [1.0, 0.5]:
+        step = round(temps[1] - temps[0], 1)
+    hvac_modes = [climate.MODE_REMO_TO_HA[m] for m in modes] + [HVAC_OFF]
+    return (
+        min_temp,
+        max_temp,
+        step,
+        hvac_modes,
+        modes[mode]["vol"],
+        modes[mode]["dir"],
+    )
+
+
+def read_cached(ac) -> tuple:
+    """Read the capabilities through the entity's properties."""
+    return (
+        ac.min_temp,
+        ac.max_temp,
+        ac.target_temperature_step,
+        ac.hvac_modes,
+        ac.fan_modes,
+        ac.swing_modes,
+    )
+
+
+def main() -> None:
+    raw = fake_appliances(1)[0]
+    appliance = models.Appliance.from_dict(raw)
+    modes = raw["aircon"]["range"]["modes"]
+
+    ac = object.__new__(climate.NatureRemoAC)
+    ac._remo_mode = "cool"
+    ac._set_range(appliance.aircon)
+
+    uncached = best_of(lambda: read_uncached(modes, "cool"), number=20000)
+    cached = best_of(lambda: read_cached(ac), number=20000)
+    print(f"derived per read: {uncached:6.2f} us per state write")
+    print(f"cached per range: {cached:6.2f} us per state write")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark decoding the /appliances payload.
+
+Compares json and orjson decode time, and the peak and retained memory of
+the decoded payload, on a recorded payload or a generated one. Run from
+the repository root:
+
+    python bench/bench_decode.py [--file appliances.json] [--appliances 1000]
+"""
+
+import argparse
+import gc
+import json
+from pathlib import Path
+import tracemalloc
+
+from common import best_of, fake_appliances, load
+
+api_module = load("nature_remo_api")
+
+
+def memory(func) -> tuple[float, float]:
+    """Return the peak and retained memory of calling func in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1024, retained / 1024
+
+
+def main(body: bytes) -> None:
+    print(f"payload: {len(body) / 1024:.0f} KiB")
+    loaders = {"json": json.loads}
+    if api_module.orjson is not None:
+        loaders["orjson"] = api_module.orjson.loads
+
+    for name, loads in loaders.items():
+        decode_us = best_of(lambda loads=loads: loads(body), number=20)
+        peak, retained = memory(lambda loads=loads: loads(body))
+        print(
+            f"{name:>7}: decode {decode_us / 1000:6.2f} ms"
+            f"  peak {peak:7.0f} KiB  retained {retained:7.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", type=Path, help="recorded /appliances payload")
+    parser.add_argument("--appliances", type=int, default=1000)
+    args = parser.parse_args()
+    if args.file:
+        payload = args.file.read_bytes()
+    else:
+        payload = json.dumps(fake_appliances(args.appliances)).encode()
+    main(payload)
@@ -0,0 +1,68 @@
+"""Benchmark the coordinator's per-refresh appliance indexes.
+
+Compares answering the lookups of one refresh by scanning the appliance
+list, as before the indexes, with building the indexes once and reading
+them. Needs Home Assistant installed, like the coordinator. Run from the
+repository root:
+
+    python bench/bench_indexes.py [--appliances 1000]
+"""
+
+import argparse
+
+from common import APPLIANCE_TYPES, best_of, fake_appliances, load
+
+models = load("models")
+coordinator_module = load("coordinator")
+
+
+def bare_coordinator():
+    """Return a coordinator with only the state the indexes need."""
+    coordinator = object.__new__(coordinator_module.NatureRemoCoordinator)
+    coordinator._appliance_ids = None
+    coordinator._added_appliances = {}
+    return coordinator
+
+
+def main(count: int) -> None:
+    raw = {appliance["id"]: appliance for appliance in fake_appliances(count)}
+    appliances = models.parse_appliances(raw)
+    device_ids = {appliance.device.id for appliance in appliances.values()}
+    signal_ids = [
+        signal.id for appliance in appliances.values() for signal in appliance.signals
+    ][::10]
+
+    def scan() -> None:
+        values = appliances.values()
+        for appliance_type in APPLIANCE_TYPES:
+            [a for a in values if a.type == appliance_type]
+        for device_id in device_ids:
+            [a for a in values if a.device.id == device_id]
+        for signal_id in signal_ids:
+            next((a, s) for a in values for s in a.signals if s.id == signal_id)
+
+    coordinator = bare_coordinator()
+
+    def indexed() -> None:
+        coordinator._build_indexes(appliances)
+        for appliance_type in APPLIANCE_TYPES:
+            coordinator.get_appliances_by_type(appliance_type)
+        for device_id in device_ids:
+            coordinator.get_appliances_for_device(device_id)
+        for signal_id in signal_ids:
+            coordinator.get_signal(signal_id)
+
+    build_us = best_of(lambda: coordinator._build_indexes(appliances), number=50)
+    print(
+        f"{count} appliances, {len(device_ids)} devices, "
+        f"{len(signal_ids)} signal lookups per refresh"
+    )
+    print(f"   scan: {best_of(scan, number=10) / 1000:7.2f} ms per refresh")
+    print(f"indexed: {best_of(indexed, number=10) / 1000:7.2f} ms per refresh")
+    print(f" (build: {build_us / 1000:7.2f} ms for the indexes alone)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--appliances", type=int, default=1000)
+    main(parser.parse_args().appliances)
@@ -0,0 +1,133 @@
+"""Helpers shared by the benchmark scripts.
+
+The repository root is the integration package itself. It is loaded under
+its domain name without running __init__.py, so the modules that do not
+need Home Assistant can be benchmarked without it installed.
+"""
+
+import importlib
+from pathlib import Path
+import random
+import sys
+import timeit
+import types
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "nature_remo"
+
+APPLIANCE_TYPES = ("AC", "TV", "LIGHT", "IR", "EL_SMART_METER")
+
+
+def load(module: str) -> types.ModuleType:
+    """Import a module of the integration."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(ROOT)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{module}")
+
+
+def best_of(func, number: int, repeat: int = 5) -> float:
+    """Return the best time per call in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def fake_devices(count: int) -> list[dict[str, Any]]:
+    """Return a /devices payload shaped like the real one."""
+    return [
+        {
+            "id": f"device-{i:04d}",
+            "name": f"Remo {i}",
+            "serial_number": f"1W3200{i:06d}",
+            "firmware_version": "Remo/1.10.0",
+            "mac_address": f"aa:bb:cc:{i >> 8 & 0xFF:02x}:{i & 0xFF:02x}:00",
+            "newest_events": {
+                "te": {"val": 22.5, "created_at": "2024-01-01T00:00:00Z"},
+                "hu": {"val": 45, "created_at": "2024-01-01T00:00:00Z"},
+                "il": {"val": 120, "created_at": "2024-01-01T00:00:00Z"},
+                "mo": {"val": 1, "created_at": "2024-01-01T00:00:00Z"},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def fake_appliances(count: int, devices: int = 10) -> list[dict[str, Any]]:
+    """Return an /appliances payload shaped like the real one.
+
+    Appliance types are mixed as in a typical home, and every appliance
+    has a few learned signals.
+    """
+    rng = random.Random(count)
+    device_list = fake_devices(devices)
+    appliances = []
+    for i in range(count):
+        appliance_type = APPLIANCE_TYPES[i % len(APPLIANCE_TYPES)]
+        appliance: dict[str, Any] = {
+            "id": f"appliance-{i:05d}",
+            "type": appliance_type,
+            "nickname": f"Appliance {i}",
+            "image": "ico_ac_1",
+            "device": device_list[rng.randrange(devices)],
+            "model": None,
+            "settings": None,
+            "aircon": None,
+            "signals": [
+                {"id": f"signal-{i:05d}-{j}", "name": f"Button {j}", "image": "ico_on"}
+                for j in range(rng.randint(1, 6))
+            ],
+        }
+        if appliance_type == "AC":
+            temps = [str(t) for t in range(16, 31)]
+            mode = {
+                "temp": temps,
+                "vol": ["1", "2", "3", "auto"],
+                "dir": ["1", "swing"],
+            }
+            appliance["aircon"] = {
+                "range": {
+                    "modes": {m: mode for m in ("cool", "warm", "dry", "blow", "auto")},
+                    "fixedButtons": ["power-off"],
+                },
+                "tempUnit": "c",
+            }
+            appliance["settings"] = {
+                "temp": "26",
+                "mode": "cool",
+                "vol": "auto",
+                "dir": "swing",
+                "button": "",
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+        elif appliance_type == "TV":
+            appliance["tv"] = {
+                "state": {"input": "t"},
+                "buttons": [
+                    {"name": name, "image": "ico_tv", "label": name}
+                    for name in ("power", "vol-up", "vol-down", "input-terrestrial")
+                ],
+            }
+        elif appliance_type == "LIGHT":
+            appliance["light"] = {
+                "state": {"brightness": "100", "power": "on", "last_button": "on"},
+                "buttons": [
+                    {"name": name, "image": "ico_light", "label": name}
+                    for name in ("on", "off", "night")
+                ],
+            }
+        elif appliance_type == "EL_SMART_METER":
+            appliance["smart_meter"] = {
+                "echonetlite_properties": [
+                    {"name": "coefficient", "epc": 211, "val": "1"},
+                    {"name": "cumulative_electric_energy_unit", "epc": 225, "val": "2"},
+                    {
+                        "name": "normal_direction_cumulative_electric_energy",
+                        "epc": 224,
+                        "val": "294675",
+                    },
+                    {"name": "measured_instantaneous", "epc": 231, "val": "1046"},
+                ]
+            }
+        appliances.append(appliance)
+    return appliances
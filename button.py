@@ -0,0 +1,118 @@
+"""Button setup for Nature Remo learned IR signals."""
+
+import logging
+
+from homeassistant.components.button import ButtonEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .base import NatureRemoBase
+from .const import DOMAIN
+from .coordinator import NatureRemoCoordinator
+from .models import Appliance, Signal
+from .nature_remo_api import APIError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Buttons."""
+    # This gets the data update coordinator from hass.data as specified in your __init__.py
+    coordinator: NatureRemoCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ].coordinator
+
+    # ----------------------------------------------------------------------------
+    # One button per learned signal. The coordinator indexes signals whenever
+    # the appliance list is refetched, so after each update only its hash is
+    # compared and buttons are only built for signals that are new.
+    # ----------------------------------------------------------------------------
+    added: set[str] = set()
+    signals_hash: int | None = None
+
+    @callback
+    def _async_add_new_signals() -> None:
+        nonlocal signals_hash
+        if coordinator.signals_hash == signals_hash:
+            return
+        signals_hash = coordinator.signals_hash
+        buttons = [
+            NatureRemoSignalButton(coordinator, appliance, signal)
+            for signal_id, (appliance, signal) in coordinator.get_signals().items()
+            if signal_id not in added
+        ]
+        if buttons:
+            added.update(button.unique_id for button in buttons)
+            async_add_entities(buttons)
+
+    _async_add_new_signals()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_signals))
+
+
+class NatureRemoSignalButton(NatureRemoBase, ButtonEntity):
+    """Implementation of a Nature Remo learned signal."""
+
+    def __init__(
+        self,
+        coordinator: NatureRemoCoordinator,
+        appliance: Appliance,
+        signal: Signal,
+    ) -> None:
+        """Init the button."""
+        super().__init__(coordinator, appliance)
+        self._appliance_name = self._name
+        self._signal_id = signal.id
+        self._name = f"{self._appliance_name} {signal.name}"
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID."""
+        return self._signal_id
+
+    @property
+    def update_context(self) -> frozenset[tuple[str, str]]:
+        """Return the coordinator keys whose changes this entity follows."""
+        return frozenset({("appliances", self._appliance_id)})
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._update_callback, self.update_context
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Follow renames and removal of the signal."""
+        if (found := self._coordinator.get_signal(self._signal_id)) is None:
+            if self._coordinator.get_appliance(self._appliance_id) is None:
+                self._async_remove_if_gone()
+            else:
+                # The appliance parsed fine, so the signal itself was deleted.
+                self._async_remove()
+            return
+        name = f"{self._appliance_name} {found[1].name}"
+        if name == self._name:
+            self._coordinator.skipped_updates += 1
+            return
+        self._name = name
+        self.async_write_ha_state()
+
+    async def async_press(self) -> None:
+        """Send the signal."""
+        _LOGGER.debug("Sending signal %s", self._signal_id)
+        try:
+            await self._coordinator.async_send_ir(
+                self._device.id, signal_id=self._signal_id
+            )
+        except APIError as err:
+            raise HomeAssistantError(
+                f"Failed to send signal {self._name}: {err}"
+            ) from err
@@ -1,6 +1,7 @@
 """Climate setup for Nature Remo."""
 
-import contextlib
+import dataclasses
+from dataclasses import dataclass
 import logging
 from typing import Any
 
@@ -8,11 +9,14 @@ from homeassistant.components import climate
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .base import NatureRemoBase
 from .const import DEFAULT_COOL_TEMP, DEFAULT_HEAT_TEMP, DOMAIN
 from .coordinator import NatureRemoCoordinator
+from .models import AirconRange, AirconSettings, Appliance, Device
+from .nature_remo_api import APIError
 
 SUPPORT_FLAGS = (
     climate.ClimateEntityFeature.TARGET_TEMPERATURE
@@ -31,6 +35,15 @@ MODE_HA_TO_REMO = {
     climate.HVACMode.OFF: "power-off",
 }
 
+# aircon_settings request fields and the AirconSettings fields they set.
+COMMAND_TO_SETTING = {
+    "temperature": "temp",
+    "operation_mode": "mode",
+    "air_volume": "vol",
+    "air_direction": "dir",
+    "button": "button",
+}
+
 MODE_REMO_TO_HA = {
     "auto": climate.HVACMode.AUTO,
     "blow": climate.HVACMode.FAN_ONLY,
@@ -41,6 +54,41 @@ MODE_REMO_TO_HA = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class ModeCapabilities:
+    """Capabilities of an AC in one operation mode."""
+
+    min_temp: float = 0
+    max_temp: float = 0
+    temp_step: float = 1
+    fan_modes: list[str] = dataclasses.field(default_factory=list)
+    swing_modes: list[str] = dataclasses.field(default_factory=list)
+
+
+NO_CAPABILITIES = ModeCapabilities()
+
+
+def _mode_capabilities(aircon: AirconRange) -> dict[str, ModeCapabilities]:
+    """Derive the capabilities of each mode from an aircon range."""
+    capabilities = {}
+    for mode, mode_range in aircon.modes.items():
+        temps = mode_range.temp
+        step = 1
+        if len(temps) >= 2:
+            # determine step from the gap of first and second temperature
+            gap = round(temps[1] - temps[0], 1)
+            if gap in [1.0, 0.5]:  # valid steps
+                step = gap
+        capabilities[mode] = ModeCapabilities(
+            min_temp=min(temps, default=0),
+            max_temp=max(temps, default=0),
+            temp_step=step,
+            fan_modes=list(mode_range.vol),
+            swing_modes=list(mode_range.dir),
+        )
+    return capabilities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -53,24 +101,20 @@ async def async_setup_entry(
     ].coordinator
 
     # ----------------------------------------------------------------------------
-    # Here we are going to add some lights entities for the lights in our mock data.
-    # We have an on/off light and a dimmable light in our mock data, so add each
-    # specific class based on the light type.
+    # The coordinator classifies appliances by type on each refresh. Entities
+    # are created for the ACs there now, and for ACs that appear later.
     # ----------------------------------------------------------------------------
-    ac = []
-
-    appliances = coordinator.data["appliances"]
-
-    ac.extend(
-        [
+    @callback
+    def _async_add_acs(appliances: list[Appliance]) -> None:
+        async_add_entities(
             NatureRemoAC(coordinator, appliance, "state")
-            for appliance in appliances.values()
-            if appliance["type"] == "AC"
-        ]
-    )
+            for appliance in appliances
+            if appliance.aircon is not None and appliance.settings is not None
+        )
 
-    # Create the AC controls
-    async_add_entities(ac)
+    config_entry.async_on_unload(
+        coordinator.async_track_appliances("AC", _async_add_acs)
+    )
 
 
 class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
@@ -84,15 +128,19 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
             climate.HVACMode.COOL: DEFAULT_COOL_TEMP,
             climate.HVACMode.HEAT: DEFAULT_HEAT_TEMP,
         }
-        self._modes = appliance["aircon"]["range"]["modes"]
         self._hvac_mode = None
         self._current_temperature = None
         self._target_temperature = None
         self._remo_mode = None
         self._fan_mode = None
         self._swing_mode = None
+        self._set_range(appliance.aircon)
         self._last_target_temperature = {v: None for v in MODE_REMO_TO_HA}
-        self._update(appliance["settings"])
+        # Settings last confirmed by the api, and the number of optimistic
+        # commands still waiting for their response.
+        self._confirmed: AirconSettings = appliance.settings
+        self._pending_commands = 0
+        self._update(appliance.settings)
 
     @property
     def supported_features(self) -> climate.const.ClimateEntityFeature:
@@ -112,18 +160,12 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature."""
-        temp_range = self._current_mode_temp_range()
-        if len(temp_range) == 0:
-            return 0
-        return min(temp_range)
+        return self._capabilities.min_temp
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        temp_range = self._current_mode_temp_range()
-        if len(temp_range) == 0:
-            return 0
-        return max(temp_range)
+        return self._capabilities.max_temp
 
     @property
     def target_temperature(self) -> float | None:
@@ -132,15 +174,9 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
         return self._target_temperature
 
     @property
-    def target_temperature_step(self) -> int:
+    def target_temperature_step(self) -> float:
         """Return the supported step of target temperature."""
-        temp_range = self._current_mode_temp_range()
-        if len(temp_range) >= 2:
-            # determine step from the gap of first and second temperature
-            step = round(temp_range[1] - temp_range[0], 1)
-            if step in [1.0, 0.5]:  # valid steps
-                return step
-        return 1
+        return self._capabilities.temp_step
 
     @property
     def hvac_mode(self) -> climate.HVACMode:
@@ -150,10 +186,7 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
     @property
     def hvac_modes(self) -> list[climate.HVACMode]:
         """Return the list of available operation modes."""
-        remo_modes = list(self._modes.keys())
-        ha_modes = [MODE_REMO_TO_HA[mode] for mode in remo_modes]
-        ha_modes.append(climate.HVACMode.OFF)
-        return ha_modes
+        return self._hvac_modes
 
     @property
     def fan_mode(self) -> str | None:
@@ -163,7 +196,7 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
     @property
     def fan_modes(self) -> list[str] | None:
         """List of available fan modes."""
-        return self._modes[self._remo_mode]["vol"]
+        return self._capabilities.fan_modes
 
     @property
     def swing_mode(self) -> str | None:
@@ -173,7 +206,7 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
     @property
     def swing_modes(self) -> list[str] | None:
         """List of available swing modes."""
-        return self._modes[self._remo_mode]["dir"]
+        return self._capabilities.swing_modes
 
     @property
     def device_state_attributes(self):
@@ -191,15 +224,7 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
             # has to cast to whole number otherwise API will return an error
             target_temp = int(target_temp)
         _LOGGER.debug("Set temperature: %d", target_temp)
-
-        response = await self.hass.async_add_executor_job(
-            self._coordinator.api.post,
-            f"/appliances/{self._appliance_id}/aircon_settings",
-            {"temperature": f"{target_temp}"},
-        )
-
-        self._update(response)
-        self.async_write_ha_state()
+        await self._post({"temperature": f"{target_temp}"})
 
     async def async_set_hvac_mode(self, hvac_mode: climate.const.HVACMode) -> None:
         """Set new target hvac mode."""
@@ -208,7 +233,9 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
         if mode == MODE_HA_TO_REMO[climate.HVACMode.OFF]:
             await self._post({"button": mode})
         else:
-            data = {"operation_mode": mode}
+            # An empty button powers the AC on, and overrides a power-off
+            # still waiting in the command queue.
+            data = {"operation_mode": mode, "button": ""}
             if self._last_target_temperature[mode]:
                 data["temperature"] = self._last_target_temperature[mode]
             elif self._default_temp.get(hvac_mode):
@@ -218,15 +245,7 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
         _LOGGER.debug("Set fan mode: %s", fan_mode)
-        # await self._post({"air_volume": fan_mode})
-        response = await self.hass.async_add_executor_job(
-            self._coordinator.api.post,
-            f"/appliances/{self._appliance_id}/aircon_settings",
-            {"air_volume": fan_mode},
-        )
-
-        self._update(response)
-        self.async_write_ha_state()
+        await self._post({"air_volume": fan_mode})
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new target swing operation."""
@@ -236,7 +255,9 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
     async def async_added_to_hass(self) -> None:
         """Subscribe to updates."""
         self.async_on_remove(
-            self._coordinator.async_add_listener(self._update_callback)
+            self._coordinator.async_add_listener(
+                self._update_callback, self.update_context
+            )
         )
 
     async def async_update(self) -> None:
@@ -246,48 +267,125 @@ class NatureRemoAC(NatureRemoBase, climate.ClimateEntity):
         """
         await self._coordinator.async_request_refresh()
 
-    def _update(self, ac_settings, device=None):
+    def _update(self, ac_settings: AirconSettings, device: Device | None = None):
+        self._settings = ac_settings
         # hold this to determin the ac mode while it's turned-off
-        self._remo_mode = ac_settings["mode"]
-        try:
-            self._target_temperature = float(ac_settings["temp"])
-            self._last_target_temperature[self._remo_mode] = ac_settings["temp"]
-        except KeyError:
-            self._target_temperature = None
-        except ValueError:
-            self._target_temperature = None
-
-        if ac_settings["button"] == MODE_HA_TO_REMO[climate.HVACMode.OFF]:
+        self._remo_mode = ac_settings.mode
+        self._target_temperature = ac_settings.temperature
+        if self._target_temperature is not None:
+            self._last_target_temperature[self._remo_mode] = ac_settings.temp
+
+        if ac_settings.button == MODE_HA_TO_REMO[climate.HVACMode.OFF]:
             self._hvac_mode = climate.HVACMode.OFF
         else:
             self._hvac_mode = MODE_REMO_TO_HA[self._remo_mode]
 
-        self._fan_mode = ac_settings["vol"] or None
-        self._swing_mode = ac_settings["dir"] or None
+        self._fan_mode = ac_settings.vol
+        self._swing_mode = ac_settings.dir
+        self._capabilities = self._mode_capabilities.get(
+            self._remo_mode, NO_CAPABILITIES
+        )
 
-        if device is not None:
-            with contextlib.suppress(KeyError):
-                self._current_temperature = float(device["newest_events"]["te"]["val"])
-                # no op
+        if device is not None and device.temperature is not None:
+            self._current_temperature = device.temperature
 
     @callback
     def _update_callback(self):
+        appliance = self._coordinator.get_appliance(self._appliance_id)
+        if appliance is None:
+            self._async_remove_if_gone()
+            return
+        if appliance.aircon is None or appliance.settings is None:
+            return
+        if appliance.aircon is not self._range and appliance.aircon != self._range:
+            self._set_range(appliance.aircon)
+        if self._pending_commands:
+            # Keep showing the optimistic settings until the command in
+            # flight is reconciled, only the room temperature is refreshed.
+            settings = self._settings
+        else:
+            settings = self._confirmed = appliance.settings
+        self._update(settings, self._coordinator.get_device(self._device.id))
+        self.async_write_ha_state()
+
+    async def _post(self, data):
+        if not self._coordinator.optimistic:
+            try:
+                response = await self._send(data)
+            except APIError as err:
+                raise HomeAssistantError(
+                    f"Failed to update {self._name}: {err}"
+                ) from err
+            self._update(AirconSettings.from_dict(response))
+            self.async_write_ha_state()
+            return
+
+        # Show the requested state straight away and send the command in the
+        # background, reconciling once the api has answered.
         self._update(
-            self._coordinator.data["appliances"][self._appliance_id]["settings"],
-            self._coordinator.data["devices"][self._device["id"]],
+            dataclasses.replace(
+                self._settings,
+                **{COMMAND_TO_SETTING[key]: value for key, value in data.items()},
+            )
         )
         self.async_write_ha_state()
+        self._pending_commands += 1
+        self.hass.async_create_task(self._async_reconcile(data))
 
-    async def _post(self, data):
-        response = await self.hass.async_add_executor_job(
-            self._coordinator.api.post,
+    async def _async_reconcile(self, data):
+        """Reconcile the optimistic state with the command's response."""
+        try:
+            response = await self._send(data)
+        except APIError as err:
+            self._pending_commands -= 1
+            _LOGGER.warning("Failed to set %s: %s", data, err)
+            if not self._pending_commands:
+                self._coordinator.optimistic_rollbacks += 1
+                self._update(self._confirmed)
+                self.async_write_ha_state()
+            return
+
+        self._pending_commands -= 1
+        if self._pending_commands:
+            # A later command will reconcile the final state.
+            return
+
+        actual = AirconSettings.from_dict(response)
+        if _comparable(actual) != _comparable(self._settings):
+            _LOGGER.debug("AC reported %s, expected %s", actual, self._settings)
+            self._coordinator.optimistic_rollbacks += 1
+        self._confirmed = actual
+        self._update(actual)
+        self.async_write_ha_state()
+
+    async def _send(self, data):
+        return await self._coordinator.async_send_command(
             f"/appliances/{self._appliance_id}/aircon_settings",
             data,
         )
 
-        self._update(response)
-        self.async_write_ha_state()
+    def _set_range(self, aircon: AirconRange) -> None:
+        """Derive and cache the capabilities of a (new) aircon range.
 
-    def _current_mode_temp_range(self):
-        temp_range = self._modes[self._remo_mode]["temp"]
-        return list(map(float, filter(None, temp_range)))
+        HA reads these on every state write, so they are only rebuilt when
+        the appliance's aircon range itself changes.
+        """
+        self._range = aircon
+        self._mode_capabilities = _mode_capabilities(aircon)
+        self._hvac_modes = [MODE_REMO_TO_HA[mode] for mode in aircon.modes]
+        self._hvac_modes.append(climate.HVACMode.OFF)
+        if self._remo_mode is not None:
+            self._capabilities = self._mode_capabilities.get(
+                self._remo_mode, NO_CAPABILITIES
+            )
+
+
+def _comparable(settings: AirconSettings) -> tuple:
+    """Return the parts of the settings an optimistic update predicts."""
+    return (
+        settings.mode,
+        settings.temperature,
+        settings.vol,
+        settings.dir,
+        settings.button == MODE_HA_TO_REMO[climate.HVACMode.OFF],
+    )
@@ -0,0 +1,89 @@
+"""Debounced, coalescing queue for commands sent to the Nature Remo API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .nature_remo_api import APIFatalError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandQueue:
+    """Coalesce commands to one api path into as few requests as possible.
+
+    Each submitted payload is merged into the pending one, later values for
+    the same key winning, and the merged payload is sent once no new
+    command has arrived for the debounce window. Batches are sent one at a
+    time in submission order, and every caller in a batch gets its result.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[dict[str, Any]], Awaitable[Any]],
+        debounce: float,
+    ) -> None:
+        """Init the queue."""
+        self._hass = hass
+        self._send = send
+        # Public so a changed option applies to queues that already exist.
+        self.debounce = debounce
+        self._pending: dict[str, Any] = {}
+        self._waiters: list[asyncio.Future[Any]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_submit(self, data: dict[str, Any]) -> Any:
+        """Queue a command and return the response of the batch it is sent in."""
+        self._pending.update(data)
+        future: asyncio.Future[Any] = self._hass.loop.create_future()
+        self._waiters.append(future)
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._hass.loop.call_later(self.debounce, self._flush)
+
+        return await future
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the pending batch, failing the callers waiting on it."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        waiters = self._waiters
+        self._pending, self._waiters = {}, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(APIFatalError("Command queue shut down"))
+
+    @callback
+    def _flush(self) -> None:
+        """Hand the pending batch over to be sent."""
+        self._timer = None
+        data, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, []
+        self._hass.async_create_task(self._async_send_batch(data, waiters))
+
+    async def _async_send_batch(
+        self, data: dict[str, Any], waiters: list[asyncio.Future[Any]]
+    ) -> None:
+        """Send a batch once any earlier batch has completed."""
+        async with self._lock:
+            _LOGGER.debug("Sending %d coalesced command(s): %s", len(waiters), data)
+            try:
+                result = await self._send(data)
+            except Exception as err:  # noqa: BLE001 - forwarded to every waiter
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+            else:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(result)
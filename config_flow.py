@@ -7,16 +7,35 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.components.zeroconf import ZeroconfServiceInfo
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_ACCESS_TOKEN, CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
-from .nature_remo_api import NatureRemoAPI
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_COMMAND_DEBOUNCE,
+    CONF_LOCAL_HOSTS,
+    CONF_OPTIMISTIC,
+    CONF_POOL_SIZE,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_POOL_SIZE,
+    DOMAIN,
+)
+from .nature_remo_api import APIConnectionError, NatureRemoAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+MAX_POOL_SIZE = 16
+MAX_COMMAND_DEBOUNCE = 5.0
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(
@@ -35,8 +54,13 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     """
     # TODO validate the data can be used to set up a connection.
 
-    api = NatureRemoAPI(data[CONF_HOST], data[CONF_ACCESS_TOKEN])
-    authenticated = await hass.async_add_executor_job(api.authenticate_check)
+    api = NatureRemoAPI(
+        data[CONF_HOST], data[CONF_ACCESS_TOKEN], async_get_clientsession(hass)
+    )
+    try:
+        authenticated = await api.authenticate_check()
+    except APIConnectionError as err:
+        raise CannotConnect from err
 
     if not authenticated:
         raise InvalidAuth
@@ -72,6 +96,105 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_zeroconf(
+        self, discovery_info: ZeroconfServiceInfo
+    ) -> ConfigFlowResult:
+        """Record the LAN address of a discovered Remo device.
+
+        Remo devices advertise themselves as Remo-XXXXXX, the suffix being the
+        end of their MAC address. The device is matched against the devices of
+        the existing entries and its host stored in that entry's options.
+        """
+        suffix = discovery_info.hostname.split(".")[0].rpartition("-")[2].lower()
+        if not suffix:
+            return self.async_abort(reason="not_remo_device")
+
+        for entry in self._async_current_entries():
+            if (
+                runtime_data := self.hass.data.get(DOMAIN, {}).get(entry.entry_id)
+            ) is None:
+                continue
+            for device in runtime_data.coordinator.data["devices"].values():
+                if not device.mac_address.replace(":", "").lower().endswith(suffix):
+                    continue
+                local_hosts = dict(entry.options.get(CONF_LOCAL_HOSTS, {}))
+                if local_hosts.get(device.id) != discovery_info.host:
+                    local_hosts[device.id] = discovery_info.host
+                    self.hass.config_entries.async_update_entry(
+                        entry, options={**entry.options, CONF_LOCAL_HOSTS: local_hosts}
+                    )
+                return self.async_abort(reason="already_configured")
+
+        return self.async_abort(reason="not_remo_device")
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return NatureRemoOptionsFlow()
+
+
+class NatureRemoOptionsFlow(OptionsFlow):
+    """Handle Nature Remo options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set the api client options and the LAN host of each Remo device.
+
+        Hosts left blank mean the device is only used through the cloud.
+        """
+        runtime_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if runtime_data is None:
+            # The device list is only known while the entry is loaded.
+            return self.async_abort(reason="not_loaded")
+        devices = runtime_data.coordinator.data["devices"].values()
+        labels = {f"{device.name} ({device.id[:8]})": device.id for device in devices}
+        options = self.config_entry.options
+        local_hosts = options.get(CONF_LOCAL_HOSTS, {})
+
+        if user_input is not None:
+            hosts = {
+                labels[label]: host.strip()
+                for label, host in user_input.items()
+                if label in labels and host.strip()
+            }
+            settings = {
+                key: value for key, value in user_input.items() if key not in labels
+            }
+            return self.async_create_entry(
+                data={**options, **settings, CONF_LOCAL_HOSTS: hosts}
+            )
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_POOL_SIZE,
+                    default=options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_POOL_SIZE)),
+                vol.Required(
+                    CONF_COMMAND_DEBOUNCE,
+                    default=options.get(
+                        CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE
+                    ),
+                ): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=MAX_COMMAND_DEBOUNCE)
+                ),
+                vol.Required(
+                    CONF_OPTIMISTIC,
+                    default=options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+                ): bool,
+                **{
+                    vol.Optional(
+                        label,
+                        description={"suggested_value": local_hosts.get(device_id)},
+                    ): str
+                    for label, device_id in labels.items()
+                },
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -4,6 +4,21 @@ DOMAIN = "nature_remo"
 HOST = "https://api.nature.global/1/"
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 10
+MAX_SCAN_INTERVAL = 300
+# Appliance definitions rarely change, so they are fetched far less often
+# than the device sensor readings.
+APPLIANCES_SCAN_INTERVAL = 600
+
+CONF_POOL_SIZE = "pool_size"
+DEFAULT_POOL_SIZE = 4
+# Seconds to wait for further changes before sending a coalesced command.
+CONF_COMMAND_DEBOUNCE = "command_debounce"
+DEFAULT_COMMAND_DEBOUNCE = 0.5
+# Apply commands to the entity before the api has confirmed them.
+CONF_OPTIMISTIC = "optimistic"
+DEFAULT_OPTIMISTIC = True
+# Local API hosts of Remo devices on the LAN, {device id: host}.
+CONF_LOCAL_HOSTS = "local_hosts"
 
 DEFAULT_COOL_TEMP = 28
 DEFAULT_HEAT_TEMP = 20
@@ -14,3 +29,4 @@ CONF_HEAT_TEMP = "heat_temperature"
 
 RENAME_DEVICE_SERVICE_NAME = "rename_device_service"
 RESPONSE_SERVICE_NAME = "response_service"
+SEND_IR_SERVICE_NAME = "send_ir"
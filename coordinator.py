@@ -1,19 +1,62 @@
 """DataUpdateCoordinator for our integration."""
 
+from collections.abc import Callable, Mapping
 from datetime import timedelta
+from functools import partial
 import logging
+import time
 from typing import Any
 
 # TODO consider using the remo python library
 # from remo import NatureRemoAPI
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN, CONF_HOST
-from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    DOMAIN as HOMEASSISTANT_DOMAIN,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .nature_remo_api import APIConnectionError, NatureRemoAPI
+from .command_queue import CommandQueue
+from .const import (
+    APPLIANCES_SCAN_INTERVAL,
+    CONF_COMMAND_DEBOUNCE,
+    CONF_LOCAL_HOSTS,
+    CONF_OPTIMISTIC,
+    CONF_POOL_SIZE,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+from .local_api import NatureRemoLocalAPI
+from .models import Appliance, Device, Signal, parse_appliances, parse_devices
+from .nature_remo_api import (
+    POLL_RESERVE,
+    APIConnectionError,
+    APIError,
+    APIRateLimitError,
+    CircuitState,
+    RateLimitBudget,
+)
+from .shared_client import async_acquire_client
 
-DEFAULT_UPDATE_INTERVAL = timedelta(seconds=60)
+DEFAULT_UPDATE_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+
+STORAGE_VERSION = 1
+# Seconds to wait before writing a changed snapshot, so bursts of updates
+# result in a single write.
+SNAPSHOT_SAVE_DELAY = 30
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,12 +65,14 @@ _LOGGER = logging.getLogger(__name__)
 class NatureRemoCoordinator(DataUpdateCoordinator):
     """Nature Remo coordinator."""
 
-    data: list[dict[str, Any]]
+    # {"appliances": {id: Appliance}, "devices": {id: Device}}
+    data: dict[str, dict[str, Any]]
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize coordinator."""
 
         # Set variables from values entered in config flow setup
+        self.entry_id = config_entry.entry_id
         self.host = config_entry.data[CONF_HOST]
         self.access_token = config_entry.data[CONF_ACCESS_TOKEN]
 
@@ -54,7 +99,84 @@ class NatureRemoCoordinator(DataUpdateCoordinator):
         )
 
         # Initialise your api here and make available to your integration.
-        self.api = NatureRemoAPI(host=self.host, access_token=self.access_token)
+        # Entries for the same account share one client (and its pooled
+        # keep-alive session), released on unload.
+        self._pool_size = config_entry.options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE)
+        self.client = async_acquire_client(
+            hass, self.host, self.access_token, self._pool_size
+        )
+        self.api = self.client.api
+        self._cancel_shared_results = self.client.async_subscribe(
+            self, self._async_handle_shared_result
+        )
+
+        # /devices is polled every update, /appliances only when this is due
+        # or after a command has been sent.
+        self._appliances_fetched_at: float | None = None
+        self._appliances_stale = True
+        # Last raw payloads, used to skip parsing when the api cache hits.
+        self._raw: dict[str, dict[str, Any]] = {}
+
+        # Last known good payload, persisted so entities can be created on
+        # startup before the cloud answers. stale is True while data still
+        # comes from that snapshot rather than a live update.
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, snapshot_storage_key(config_entry.entry_id)
+        )
+        self.stale = False
+        self.snapshot_saved_at: str | None = None
+        self._snapshot_pending = False
+
+        # One command queue per api path, e.g. an appliance's aircon_settings.
+        self._command_debounce = config_entry.options.get(
+            CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE
+        )
+        self._command_queues: dict[str, CommandQueue] = {}
+
+        self.optimistic = config_entry.options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC)
+        # Number of optimistic states that had to be corrected or rolled back.
+        self.optimistic_rollbacks = 0
+
+        # Devices reachable over the LAN, discovered by zeroconf or configured
+        # in the options. Their local clients are created on first use.
+        self.local_hosts: dict[str, str] = dict(
+            config_entry.options.get(CONF_LOCAL_HOSTS, {})
+        )
+        self._local_apis: dict[str, NatureRemoLocalAPI] = {}
+
+        # Keys (("appliances" | "devices", id)) that changed in the last
+        # update, or None when every listener must be called.
+        self._changed: set[tuple[str, str]] | None = None
+        self._notified_success: bool | None = None
+        # Number of listener calls skipped because their data was unchanged.
+        self.skipped_updates = 0
+
+        # Lookup indexes, rebuilt whenever the appliance list is refetched.
+        self._appliances_by_device: dict[str, list[Appliance]] = {}
+        self._appliances_by_type: dict[str, list[Appliance]] = {}
+        # Appliances that appeared in the last index rebuild, by type, handed
+        # to the platforms tracking that type on the next listener update.
+        self._appliance_ids: set[str] | None = None
+        # Ids in the last raw /appliances payload, the ones missing from it
+        # that were in the one before, and the ones missing from two fetches
+        # in a row, which only then count as removed from the account.
+        self._raw_appliance_ids: set[str] | None = None
+        self._absent_appliance_ids: set[str] = set()
+        self._gone_appliance_ids: set[str] = set()
+        self._newly_gone: set[str] = set()
+        # The same for Remo devices in the raw /devices payload, whose device
+        # registry entries are only detached once they are gone.
+        self._raw_device_ids: set[str] | None = None
+        self._absent_device_ids: set[str] = set()
+        self._newly_gone_devices: set[str] = set()
+        self._added_appliances: dict[str, list[Appliance]] = {}
+        self._appliance_trackers: dict[
+            str, list[Callable[[list[Appliance]], None]]
+        ] = {}
+        # Learned signals by id with the appliance they belong to, and a hash
+        # of their ids so platforms can tell cheaply whether the set changed.
+        self._signals: dict[str, tuple[Appliance, Signal]] = {}
+        self.signals_hash: int | None = None
 
     async def async_update_data(self):
         """Fetch data from API endpoint.
@@ -67,7 +189,16 @@ class NatureRemoCoordinator(DataUpdateCoordinator):
             # Get the data from your api
             # NOTE: Change this to use a real api call for data
             # ----------------------------------------------------------------------------
-            data = await self.hass.async_add_executor_job(self.api.get)
+            data = await self._async_fetch()
+        except APIRateLimitError as err:
+            if self.data is None:
+                raise UpdateFailed(err) from err
+            # Leave the remaining budget for user commands and keep serving
+            # the last known data until the budget resets.
+            _LOGGER.debug("Deferring poll: %s", err)
+            self._changed = set()
+            self._adapt_update_interval(changed=False)
+            return self.data
         except APIConnectionError as err:
             _LOGGER.error(err)
             raise UpdateFailed(err) from err
@@ -75,27 +206,494 @@ class NatureRemoCoordinator(DataUpdateCoordinator):
             # This will show entities as unavailable by raising UpdateFailed exception
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        return self._async_handle_data(data)
+
+    @callback
+    def _async_handle_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Diff, index and persist freshly fetched data before it is stored."""
+        self.stale = False
+        if self._newly_gone_devices:
+            self._async_remove_devices(self._newly_gone_devices)
+            self._newly_gone_devices = set()
+        self._changed = _diff(self.data, data)
+        if self._changed is not None and self._newly_gone:
+            # Wake the entities of appliances that are now known to be gone.
+            self._changed.update(("appliances", key) for key in self._newly_gone)
+        self._newly_gone = set()
+        activity = self._has_activity(data)
+        # The snapshot only has to recreate the entities on startup, so new
+        # sensor events and smart meter readings are not worth a write.
+        if activity or data["devices"].keys() != self.data["devices"].keys():
+            self._snapshot_pending = True
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        if self.data is None or data["appliances"] is not self.data["appliances"]:
+            self._build_indexes(data["appliances"])
+        self._adapt_update_interval(changed=activity)
+
         # What is returned here is stored in self.data by the DataUpdateCoordinator
         return data
 
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch and parse devices, and appliances too when they are due."""
+        if self.data is None or self._appliances_due():
+            raw = await self.client.get(self)
+            return self._load(raw["devices"], raw["appliances"])
+        return self._load(await self.client.get_devices(self))
+
+    def _load(
+        self, raw_devices: dict[str, Any], raw_appliances: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Parse fetched payloads, keeping the appliances if none were fetched."""
+        if raw_appliances is None:
+            appliances = self.data["appliances"]
+        else:
+            self._track_absent_appliances(raw_appliances)
+            self._appliances_fetched_at = time.monotonic()
+            self._appliances_stale = False
+            appliances = self._parse("appliances", raw_appliances)
+        self._track_absent_devices(raw_devices)
+        return {
+            "appliances": appliances,
+            "devices": self._parse("devices", raw_devices),
+        }
+
+    @callback
+    def _async_handle_shared_result(self, name: str, raw: dict[str, Any]) -> None:
+        """Take a poll made by another entry of the account as our update.
+
+        This also restarts our own poll timer, so entries sharing a client
+        poll on one schedule. Devices alone are not taken while our
+        appliances are due, e.g. for a smart meter, our own poll fetches
+        them instead.
+        """
+        if self.data is None or (name == "devices" and self._appliances_due()):
+            return
+        try:
+            if name == "all":
+                data = self._load(raw["devices"], raw["appliances"])
+            else:
+                data = self._load(raw)
+        except Exception as err:  # noqa: BLE001 - our own poll reports it
+            _LOGGER.debug("Ignoring a shared result that failed to parse: %s", err)
+            return
+        self.async_set_updated_data(self._async_handle_data(data))
+
+    def _track_absent_appliances(self, raw: dict[str, Any]) -> None:
+        """Find appliances missing from two consecutive /appliances fetches.
+
+        Ids are taken from the raw payload, so an appliance that merely
+        failed to parse is not mistaken for one that was removed.
+        """
+        ids = set(raw)
+        if self._raw_appliance_ids is not None:
+            self._newly_gone |= self._absent_appliance_ids - ids
+            self._gone_appliance_ids |= self._newly_gone
+            if self._appliance_ids is not None:
+                # Forget them, so they are added again should they return.
+                self._appliance_ids -= self._newly_gone
+            self._absent_appliance_ids = self._raw_appliance_ids - ids
+        self._gone_appliance_ids -= ids
+        self._raw_appliance_ids = ids
+
+    def _track_absent_devices(self, raw: dict[str, Any]) -> None:
+        """Find Remo devices missing from two consecutive /devices fetches.
+
+        As for appliances, a device that failed to parse or was left out of
+        one partial response is not mistaken for one that was removed.
+        """
+        ids = set(raw)
+        if self._raw_device_ids is not None:
+            self._newly_gone_devices |= self._absent_device_ids - ids
+            self._absent_device_ids = self._raw_device_ids - ids
+        self._raw_device_ids = ids
+
+    def is_appliance_gone(self, appliance_id: str) -> bool:
+        """Return whether an appliance was removed from the account."""
+        return appliance_id in self._gone_appliance_ids
+
+    def _parse(self, kind: str, raw: dict[str, Any]) -> dict[str, Any]:
+        """Parse a payload, reusing the previous models if it is unchanged.
+
+        The api returns the identical object when a response is served from
+        its cache, which also keeps the diff and index rebuild cheap.
+        """
+        if self.data is not None and raw is self._raw.get(kind):
+            return self.data[kind]
+        self._raw[kind] = raw
+        if kind == "appliances":
+            return parse_appliances(raw)
+        return parse_devices(raw)
+
+    async def async_load_snapshot(self) -> bool:
+        """Load the last known payload from storage as stale data.
+
+        Returns whether a usable snapshot was found.
+        """
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+        try:
+            data = {
+                "appliances": parse_appliances(snapshot["appliances"]),
+                "devices": parse_devices(snapshot["devices"]),
+            }
+        except (KeyError, TypeError, AttributeError):
+            _LOGGER.warning("Ignoring unreadable Nature Remo snapshot")
+            return False
+
+        self.data = data
+        self._build_indexes(data["appliances"])
+        self.stale = True
+        self.snapshot_saved_at = snapshot.get("saved_at")
+        _LOGGER.debug("Restored snapshot saved at %s", self.snapshot_saved_at)
+        return True
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the raw payload to persist."""
+        self._snapshot_pending = False
+        self.snapshot_saved_at = dt_util.utcnow().isoformat()
+        return {
+            "saved_at": self.snapshot_saved_at,
+            "appliances": self._raw.get("appliances", {}),
+            "devices": self._raw.get("devices", {}),
+        }
+
+    @property
+    def _has_smart_meter(self) -> bool:
+        """Return whether a smart meter is present.
+
+        Smart meter readings are only reported in /appliances, so it is then
+        fetched on every update.
+        """
+        return bool(self._appliances_by_type.get("EL_SMART_METER"))
+
+    def _appliances_due(self) -> bool:
+        """Return whether /appliances should be fetched on this update."""
+        return (
+            self._appliances_stale
+            or self._has_smart_meter
+            or self._appliances_fetched_at is None
+            or time.monotonic() - self._appliances_fetched_at
+            >= APPLIANCES_SCAN_INTERVAL
+        )
+
+    def _has_activity(self, data: dict[str, Any]) -> bool:
+        """Return whether the last update changed something worth polling for.
+
+        Only appliance changes count, e.g. settings changed with a physical
+        remote. New sensor events on devices and smart meter readings change
+        on nearly every poll and would otherwise keep it at the fastest rate.
+        """
+        if self._changed is None:
+            return True
+        for kind, key in self._changed:
+            if kind != "appliances":
+                continue
+            appliance = data["appliances"].get(key) or self.data["appliances"].get(key)
+            if appliance is None or appliance.type != "EL_SMART_METER":
+                return True
+        return False
+
+    def _adapt_update_interval(self, changed: bool) -> None:
+        """Poll fast while things are changing and back off while idle.
+
+        The interval never drops below what the remaining rate limit budget
+        can sustain until it resets. Entries sharing the client poll on one
+        schedule, so the budget is not split between them.
+        """
+        if changed:
+            seconds = MIN_SCAN_INTERVAL
+        else:
+            seconds = min(self.update_interval.total_seconds() * 2, MAX_SCAN_INTERVAL)
+
+        budget = self.rate_limit
+        if budget.remaining is not None and budget.seconds_until_reset > 0:
+            # A steady state poll costs one request (/devices), or two when
+            # /appliances is fetched every time for a smart meter.
+            requests_per_poll = 2 if self._has_smart_meter else 1
+            polls_left = max((budget.remaining - POLL_RESERVE) // requests_per_poll, 1)
+            seconds = max(seconds, budget.seconds_until_reset / polls_left)
+
+        self.update_interval = timedelta(seconds=seconds)
+
+    @callback
+    def _async_remove_devices(self, device_ids: set[str]) -> None:
+        """Detach Remo devices that left the account from this entry.
+
+        The device registry removes a device, and with it its entities, once
+        no config entry is left using it.
+        """
+        device_registry = dr.async_get(self.hass)
+        for device_id in device_ids:
+            device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+            if device is None:
+                continue
+            _LOGGER.debug("Removing device %s, it is no longer reported", device_id)
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.entry_id
+            )
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes and pending commands on unload.
+
+        A pending snapshot write is flushed now, so its timer cannot write
+        the file back after the entry was removed.
+        """
+        await super().async_shutdown()
+        self._cancel_shared_results()
+        if self._snapshot_pending:
+            await self._store.async_save(self._snapshot())
+        for queue in self._command_queues.values():
+            queue.async_shutdown()
+        self._command_queues.clear()
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> bool:
+        """Apply changed options without reloading the entry.
+
+        Returns False if the entry must be reloaded instead, which is only
+        the case when the connection pool size of the shared client changed.
+        """
+        self.local_hosts = dict(options.get(CONF_LOCAL_HOSTS, {}))
+        self._local_apis = {
+            device_id: local_api
+            for device_id, local_api in self._local_apis.items()
+            if self.local_hosts.get(device_id) == local_api.host
+        }
+        self.optimistic = options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC)
+        self._command_debounce = options.get(
+            CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE
+        )
+        for queue in self._command_queues.values():
+            queue.debounce = self._command_debounce
+        return options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE) == self._pool_size
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call only the listeners whose appliance or device data changed.
+
+        Listeners registered with a context of ("appliances" | "devices", id)
+        keys are skipped when none of those keys changed. Listeners without a
+        context are always called, and so is everyone when availability flips.
+        """
+        if self._added_appliances:
+            added, self._added_appliances = self._added_appliances, {}
+            for appliance_type, appliances in added.items():
+                for add_callback in list(
+                    self._appliance_trackers.get(appliance_type, ())
+                ):
+                    add_callback(appliances)
+
+        changed = self._changed
+        if self.last_update_success != self._notified_success:
+            changed = None
+        self._notified_success = self.last_update_success
+        self._changed = None
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+            else:
+                self.skipped_updates += 1
+
+    async def async_send_command(self, path: str, data: dict[str, Any]) -> Any:
+        """Send a command through the debounced queue for its path.
+
+        Commands to the same path that arrive within the debounce window are
+        merged into a single request, and the response is returned to each
+        caller.
+        """
+        if (queue := self._command_queues.get(path)) is None:
+            queue = self._command_queues[path] = CommandQueue(
+                self.hass,
+                partial(self._async_post_command, path),
+                self._command_debounce,
+            )
+        return await queue.async_submit(data)
+
+    async def async_press_button(self, path: str, button: str) -> Any:
+        """Press a remote button, bypassing the command queue.
+
+        Buttons such as power or volume up are toggles and steps, so every
+        press must reach the device: they are neither merged nor retried.
+        """
+        return await self.api.post(path, {"button": button}, idempotent=False)
+
+    @property
+    def command_debounce(self) -> float:
+        """Return the window in which commands are coalesced."""
+        return self._command_debounce
+
+    async def _async_post_command(self, path: str, data: dict[str, Any]) -> Any:
+        """Post a command and poll soon after for its effect."""
+        response = await self.api.post(path, data)
+        self.async_note_command()
+        return response
+
+    def get_local_api(self, device_id: str) -> NatureRemoLocalAPI | None:
+        """Get the local api client of a device, if it has a known host."""
+        if (host := self.local_hosts.get(device_id)) is None:
+            return None
+        local_api = self._local_apis.get(device_id)
+        if local_api is None or local_api.host != host:
+            local_api = self._local_apis[device_id] = NatureRemoLocalAPI(
+                host, async_get_clientsession(self.hass)
+            )
+        return local_api
+
+    async def async_send_ir(
+        self,
+        device_id: str,
+        message: dict[str, Any] | None = None,
+        signal_id: str | None = None,
+    ) -> None:
+        """Send an IR signal, over the LAN when possible.
+
+        A raw message is sent through the device's local api. If that is not
+        possible or fails, the learned cloud signal is sent instead.
+        """
+        if message is not None and (local_api := self.get_local_api(device_id)):
+            try:
+                await local_api.send_message(message)
+            except APIError as err:
+                if signal_id is None:
+                    raise
+                _LOGGER.debug("Local send failed, falling back to cloud: %s", err)
+            else:
+                return
+        if signal_id is None:
+            raise APIError(f"No local host or signal to send IR through {device_id}")
+        await self.api.post(f"/signals/{signal_id}/send", {}, idempotent=False)
+
+    @callback
+    def async_note_command(self) -> None:
+        """Poll soon after a command so its effect shows up quickly."""
+        self._appliances_stale = True
+        self.client.invalidate()
+        self.update_interval = timedelta(seconds=MIN_SCAN_INTERVAL)
+        if self._listeners:
+            self._schedule_refresh()
+
+    @property
+    def rate_limit(self) -> RateLimitBudget:
+        """Return the api rate limit budget."""
+        return self.api.rate_limit
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Return the api circuit breaker state."""
+        return self.api.breaker.state
+
     # ----------------------------------------------------------------------------
     # Here we add some custom functions on our data coordinator to be called
     # from entity platforms to get access to the specific data they want.
     #
     # These will be specific to your api or yo may not need them at all
     # ----------------------------------------------------------------------------
-    def get_device(self, device_id: int) -> dict[str, Any]:
-        """Get a device entity from our api data."""
-        try:
-            return [
-                devices for devices in self.data if devices["device_id"] == device_id
-            ][0]
-        except (TypeError, IndexError):
-            # In this case if the device id does not exist you will get an IndexError.
-            # If api did not return any data, you will get TypeError.
+    def _build_indexes(self, appliances: dict[str, Appliance]) -> None:
+        """Classify appliances and index their signals in one pass.
+
+        Appliances are bucketed by device and by type (AC, TV, LIGHT, IR,
+        EL_SMART_METER, ...), and the ones not seen before are collected by
+        type for the platforms tracking them.
+        """
+        by_device: dict[str, list[Appliance]] = {}
+        by_type: dict[str, list[Appliance]] = {}
+        signals: dict[str, tuple[Appliance, Signal]] = {}
+        for appliance in appliances.values():
+            by_device.setdefault(appliance.device.id, []).append(appliance)
+            by_type.setdefault(appliance.type, []).append(appliance)
+            for signal in appliance.signals:
+                signals[signal.id] = (appliance, signal)
+            if (
+                self._appliance_ids is not None
+                and appliance.id not in self._appliance_ids
+            ):
+                self._added_appliances.setdefault(appliance.type, []).append(appliance)
+        # Appliances stay known until they are gone, so one that failed to
+        # parse for a while is not added again when it parses once more.
+        self._appliance_ids = (self._appliance_ids or set()) | set(appliances)
+        self._appliances_by_device = by_device
+        self._appliances_by_type = by_type
+        self._signals = signals
+        self.signals_hash = hash(tuple(signals))
+
+    def get_appliance(self, appliance_id: str) -> Appliance | None:
+        """Get an appliance from our api data."""
+        if self.data is None:
+            return None
+        return self.data["appliances"].get(appliance_id)
+
+    def get_device(self, device_id: str) -> Device | None:
+        """Get a device from our api data."""
+        if self.data is None:
             return None
+        return self.data["devices"].get(device_id)
+
+    def get_appliances_for_device(self, device_id: str) -> list[Appliance]:
+        """Get the appliances controlled by a device."""
+        return self._appliances_by_device.get(device_id, [])
+
+    def get_appliances_by_type(self, appliance_type: str) -> list[Appliance]:
+        """Get the appliances of a type, e.g. AC."""
+        return self._appliances_by_type.get(appliance_type, [])
 
-    def get_device_parameter(self, device_id: int, parameter: str) -> Any:
+    @callback
+    def async_track_appliances(
+        self,
+        appliance_type: str,
+        add_callback: Callable[[list[Appliance]], None],
+    ) -> CALLBACK_TYPE:
+        """Call back with the appliances of a type, now and as they appear.
+
+        The callback is first called with every appliance of the type, and
+        after that only with the ones a refresh added.
+        """
+        trackers = self._appliance_trackers.setdefault(appliance_type, [])
+        trackers.append(add_callback)
+        if appliances := self.get_appliances_by_type(appliance_type):
+            add_callback(appliances)
+
+        @callback
+        def _remove_tracker() -> None:
+            trackers.remove(add_callback)
+
+        return _remove_tracker
+
+    def get_signal(self, signal_id: str) -> tuple[Appliance, Signal] | None:
+        """Get a learned signal and the appliance it belongs to."""
+        return self._signals.get(signal_id)
+
+    def get_signals(self) -> dict[str, tuple[Appliance, Signal]]:
+        """Get every learned signal by id."""
+        return self._signals
+
+    def get_device_parameter(self, device_id: str, parameter: str) -> Any:
         """Get the parameter value of one of our devices from our api data."""
         if device := self.get_device(device_id):
-            return device.get(parameter)
+            return getattr(device, parameter, None)
+
+
+def snapshot_storage_key(entry_id: str) -> str:
+    """Return the storage key of a config entry's snapshot."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+def _diff(
+    old: dict[str, Any] | None, new: dict[str, Any]
+) -> set[tuple[str, str]] | None:
+    """Return the appliance and device keys that differ between payloads."""
+    if old is None:
+        return None
+    changed = set()
+    for kind in ("appliances", "devices"):
+        before, after = old[kind], new[kind]
+        if before is after:
+            continue
+        changed.update(
+            (kind, key)
+            for key in before.keys() | after.keys()
+            if before.get(key) != after.get(key)
+        )
+    return changed
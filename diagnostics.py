@@ -0,0 +1,42 @@
+"""Diagnostics support for Nature Remo."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import NatureRemoCoordinator
+
+TO_REDACT = {CONF_ACCESS_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: NatureRemoCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ].coordinator
+
+    return {
+        "entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
+        "api": {
+            "rate_limit": asdict(coordinator.rate_limit),
+            "cache": coordinator.api.cache_stats,
+            "circuit": coordinator.circuit_state,
+            "consecutive_failures": coordinator.api.breaker.failures,
+        },
+        "coordinator": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "skipped_updates": coordinator.skipped_updates,
+            "stale": coordinator.stale,
+            "snapshot_saved_at": coordinator.snapshot_saved_at,
+            "optimistic_rollbacks": coordinator.optimistic_rollbacks,
+        },
+    }
@@ -0,0 +1,83 @@
+"""Decoding of the ECHONET Lite properties reported by Nature Remo E."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Low-voltage smart electric energy meter properties, keyed by EPC.
+EPC_COEFFICIENT = 0xD3
+EPC_CUMULATIVE_DIGITS = 0xD7
+EPC_NORMAL_CUMULATIVE = 0xE0
+EPC_CUMULATIVE_UNIT = 0xE1
+EPC_REVERSE_CUMULATIVE = 0xE3
+EPC_INSTANTANEOUS_POWER = 0xE7
+
+# Multiplier (kWh) for each cumulative energy unit code.
+CUMULATIVE_UNITS = {
+    0x00: 1,
+    0x01: 0.1,
+    0x02: 0.01,
+    0x03: 0.001,
+    0x04: 0.0001,
+    0x0A: 10,
+    0x0B: 100,
+    0x0C: 1000,
+    0x0D: 10000,
+}
+
+# The EPCs we decode, and the SmartMeterReading slot each one fills. Every
+# value arrives as a decimal string.
+EPC_FIELDS = {
+    EPC_COEFFICIENT: "coefficient",
+    EPC_CUMULATIVE_DIGITS: "digits",
+    EPC_NORMAL_CUMULATIVE: "normal",
+    EPC_CUMULATIVE_UNIT: "unit",
+    EPC_REVERSE_CUMULATIVE: "reverse",
+    EPC_INSTANTANEOUS_POWER: "power",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SmartMeterReading:
+    """Decoded smart meter values."""
+
+    power: int | None = None
+    energy_imported: float | None = None
+    energy_exported: float | None = None
+
+
+def decode(properties: Iterable[tuple[int, str]]) -> SmartMeterReading:
+    """Decode (epc, val) pairs into power (W) and cumulative energy (kWh).
+
+    Cumulative counters are scaled by the coefficient and unit, and wrapped
+    to the meter's number of effective digits.
+    """
+    raw: dict[str, int] = {}
+    for epc, val in properties:
+        if (name := EPC_FIELDS.get(epc)) is None:
+            continue
+        try:
+            raw[name] = int(val)
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed ECHONET Lite value %s=%s", epc, val)
+
+    multiplier = raw.get("coefficient", 1) * CUMULATIVE_UNITS.get(raw.get("unit", 0), 1)
+    modulus = 10 ** raw["digits"] if raw.get("digits") else None
+
+    def energy(name: str) -> float | None:
+        if (value := raw.get(name)) is None:
+            return None
+        if modulus is not None:
+            value %= modulus
+        # Round away float noise introduced by fractional units.
+        return round(value * multiplier, 4)
+
+    return SmartMeterReading(
+        power=raw.get("power"),
+        energy_imported=energy("normal"),
+        energy_exported=energy("reverse"),
+    )
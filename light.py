@@ -0,0 +1,196 @@
+"""Light setup for Nature Remo."""
+
+import dataclasses
+import logging
+from typing import Any
+
+from homeassistant.components.light import (
+    ATTR_EFFECT,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .base import NatureRemoBase
+from .const import DOMAIN
+from .coordinator import NatureRemoCoordinator
+from .models import Appliance, LightState
+from .nature_remo_api import APIError
+
+_LOGGER = logging.getLogger(__name__)
+
+BUTTON_ON = "on"
+BUTTON_OFF = "off"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Lights."""
+    # This gets the data update coordinator from hass.data as specified in your __init__.py
+    coordinator: NatureRemoCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ].coordinator
+
+    # ----------------------------------------------------------------------------
+    # The light state and remote buttons are parsed once per refresh by the
+    # coordinator, so entities only read the models. Lights that appear in a
+    # later refresh are added as they show up.
+    # ----------------------------------------------------------------------------
+    @callback
+    def _async_add_lights(appliances: list[Appliance]) -> None:
+        async_add_entities(
+            NatureRemoLight(coordinator, appliance)
+            for appliance in appliances
+            if appliance.light is not None
+        )
+
+    config_entry.async_on_unload(
+        coordinator.async_track_appliances("LIGHT", _async_add_lights)
+    )
+
+
+class NatureRemoLight(NatureRemoBase, LightEntity):
+    """Implementation of a Nature Remo light.
+
+    Remote buttons other than on and off, e.g. night light, are offered as
+    effects.
+    """
+
+    _attr_color_mode = ColorMode.ONOFF
+
+    def __init__(
+        self, coordinator: NatureRemoCoordinator, appliance: Appliance
+    ) -> None:
+        """Init the light."""
+        super().__init__(coordinator, appliance)
+        self._attr_supported_color_modes = {ColorMode.ONOFF}
+        self._set_buttons(appliance.light.buttons)
+        # State last confirmed by the api, and the number of optimistic
+        # commands still waiting for their response.
+        self._confirmed = self._state = appliance.light.state
+        self._pending_commands = 0
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the light is on."""
+        return self._state.is_on
+
+    @property
+    def effect(self) -> str | None:
+        """Return the last effect button pressed, if the light is on."""
+        if self._state.is_on and self._state.last_button in self._effects:
+            return self._state.last_button
+        return None
+
+    @property
+    def effect_list(self) -> list[str] | None:
+        """Return the effect buttons of the remote."""
+        return self._effects or None
+
+    @property
+    def update_context(self) -> frozenset[tuple[str, str]]:
+        """Return the coordinator keys whose changes this entity follows."""
+        return frozenset({("appliances", self._appliance_id)})
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the light on, or press an effect button."""
+        await self._post(kwargs.get(ATTR_EFFECT) or BUTTON_ON)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the light off."""
+        await self._post(BUTTON_OFF)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._update_callback, self.update_context
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        appliance = self._coordinator.get_appliance(self._appliance_id)
+        if appliance is None:
+            self._async_remove_if_gone()
+            return
+        if appliance.light is None:
+            return
+        if appliance.light.buttons != self._buttons:
+            self._set_buttons(appliance.light.buttons)
+        self._confirmed = appliance.light.state
+        if not self._pending_commands:
+            # Keep showing the optimistic state until the command in flight
+            # is reconciled.
+            self._state = self._confirmed
+        self.async_write_ha_state()
+
+    async def _post(self, button: str) -> None:
+        if not self._coordinator.optimistic:
+            try:
+                response = await self._send(button)
+            except APIError as err:
+                raise HomeAssistantError(
+                    f"Failed to press {button} on {self._name}: {err}"
+                ) from err
+            self._confirmed = self._state = LightState.from_dict(response)
+            self.async_write_ha_state()
+            return
+
+        # Show the requested state straight away and send the command in the
+        # background, reconciling once the api has answered.
+        self._state = dataclasses.replace(
+            self._state,
+            power=BUTTON_OFF if button == BUTTON_OFF else BUTTON_ON,
+            last_button=button,
+        )
+        self.async_write_ha_state()
+        self._pending_commands += 1
+        self.hass.async_create_task(self._async_reconcile(button))
+
+    async def _async_reconcile(self, button: str) -> None:
+        """Reconcile the optimistic state with the command's response."""
+        try:
+            response = await self._send(button)
+        except APIError as err:
+            self._pending_commands -= 1
+            _LOGGER.warning("Failed to press %s on %s: %s", button, self._name, err)
+            if not self._pending_commands:
+                self._coordinator.optimistic_rollbacks += 1
+                self._state = self._confirmed
+                self.async_write_ha_state()
+            return
+
+        self._pending_commands -= 1
+        if self._pending_commands:
+            # A later command will reconcile the final state.
+            return
+
+        actual = LightState.from_dict(response)
+        if actual.power != self._state.power:
+            _LOGGER.debug("Light reported %s, expected %s", actual, self._state)
+            self._coordinator.optimistic_rollbacks += 1
+        self._confirmed = self._state = actual
+        self.async_write_ha_state()
+
+    async def _send(self, button: str):
+        return await self._coordinator.async_send_command(
+            f"/appliances/{self._appliance_id}/light", {"button": button}
+        )
+
+    def _set_buttons(self, buttons: tuple[str, ...]) -> None:
+        """Cache the remote's buttons and the effects derived from them."""
+        self._buttons = buttons
+        self._effects = [
+            button for button in buttons if button not in (BUTTON_ON, BUTTON_OFF)
+        ]
+        self._attr_supported_features = (
+            LightEntityFeature.EFFECT if self._effects else LightEntityFeature(0)
+        )
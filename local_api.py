@@ -0,0 +1,62 @@
+"""Client for the local HTTP API a Nature Remo device serves on the LAN."""
+
+import logging
+from typing import Any
+
+import aiohttp
+
+from .nature_remo_api import APIConnectionError, APIFatalError
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCAL_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+# The device rejects requests without this header.
+LOCAL_HEADERS = {"X-Requested-With": "local"}
+
+
+class NatureRemoLocalAPI:
+    """Nature Remo local API client.
+
+    The local API only deals in raw IR messages, e.g.
+    {"format": "us", "freq": 38, "data": [...]}, and needs no token.
+    """
+
+    def __init__(self, host: str, session: aiohttp.ClientSession) -> None:
+        """Init local API client."""
+        self.host = host
+        self._session = session
+
+    async def _request(self, method: str, json: Any = None) -> Any:
+        """Send a request to /messages and return the response body."""
+        try:
+            async with self._session.request(
+                method,
+                f"http://{self.host}/messages",
+                json=json,
+                headers=LOCAL_HEADERS,
+                timeout=LOCAL_REQUEST_TIMEOUT,
+            ) as response:
+                if response.status >= 500:
+                    raise APIConnectionError(
+                        f"Remo at {self.host} returned {response.status}"
+                    )
+                if response.status >= 400:
+                    raise APIFatalError(
+                        f"Remo at {self.host} rejected message with {response.status}"
+                    )
+                if method == "GET":
+                    return await response.json(content_type=None)
+                return None
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise APIConnectionError(
+                f"Error contacting Remo at {self.host}: {err}"
+            ) from err
+
+    async def get_message(self) -> dict[str, Any]:
+        """Get the last IR message the device received."""
+        return await self._request("GET")
+
+    async def send_message(self, message: dict[str, Any]) -> None:
+        """Send a raw IR message."""
+        _LOGGER.debug("Sending IR message through %s", self.host)
+        await self._request("POST", message)
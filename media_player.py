@@ -0,0 +1,250 @@
+"""Media player setup for Nature Remo TVs."""
+
+import asyncio
+import logging
+
+from homeassistant.components.media_player import (
+    MediaPlayerEntity,
+    MediaPlayerEntityFeature,
+    MediaPlayerState,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .base import NatureRemoBase
+from .const import DOMAIN
+from .coordinator import NatureRemoCoordinator
+from .models import Appliance, Tv
+from .nature_remo_api import APIError
+
+_LOGGER = logging.getLogger(__name__)
+
+BUTTON_POWER = "power"
+BUTTON_MUTE = "mute"
+BUTTON_VOLUME_UP = "vol-up"
+BUTTON_VOLUME_DOWN = "vol-down"
+BUTTON_CHANNEL_UP = "ch-up"
+BUTTON_CHANNEL_DOWN = "ch-down"
+INPUT_BUTTON_PREFIX = "input-"
+
+# The selected input as reported in the TV state, and its remote button.
+INPUT_STATE_TO_BUTTON = {
+    "t": "input-terrestrial",
+    "bs": "input-bs",
+    "cs": "input-cs",
+}
+
+# Most volume presses sent in one burst, however many steps were requested.
+MAX_VOLUME_BURST = 10
+
+BUTTON_FEATURES = {
+    BUTTON_POWER: MediaPlayerEntityFeature.TURN_ON | MediaPlayerEntityFeature.TURN_OFF,
+    BUTTON_MUTE: MediaPlayerEntityFeature.VOLUME_MUTE,
+    BUTTON_VOLUME_UP: MediaPlayerEntityFeature.VOLUME_STEP,
+    BUTTON_VOLUME_DOWN: MediaPlayerEntityFeature.VOLUME_STEP,
+    BUTTON_CHANNEL_UP: MediaPlayerEntityFeature.NEXT_TRACK,
+    BUTTON_CHANNEL_DOWN: MediaPlayerEntityFeature.PREVIOUS_TRACK,
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Media Players."""
+    # This gets the data update coordinator from hass.data as specified in your __init__.py
+    coordinator: NatureRemoCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ].coordinator
+
+    @callback
+    def _async_add_tvs(appliances: list[Appliance]) -> None:
+        async_add_entities(
+            NatureRemoTV(coordinator, appliance)
+            for appliance in appliances
+            if appliance.tv is not None
+        )
+
+    config_entry.async_on_unload(
+        coordinator.async_track_appliances("TV", _async_add_tvs)
+    )
+
+
+class NatureRemoTV(NatureRemoBase, MediaPlayerEntity):
+    """Implementation of a Nature Remo TV.
+
+    The TV only reports its input, so power and mute are assumed from the
+    buttons pressed through Home Assistant.
+    """
+
+    _attr_assumed_state = True
+
+    def __init__(
+        self, coordinator: NatureRemoCoordinator, appliance: Appliance
+    ) -> None:
+        """Init the TV."""
+        super().__init__(coordinator, appliance)
+        self._set_buttons(appliance.tv.buttons)
+        self._tv = appliance.tv
+        self._attr_state = None
+        self._attr_is_volume_muted = None
+        # Net volume steps requested within the debounce window, sent as one
+        # burst of presses once it has passed.
+        self._volume_steps = 0
+        self._volume_timer: asyncio.TimerHandle | None = None
+        self._volume_lock = asyncio.Lock()
+
+    @property
+    def source(self) -> str | None:
+        """Return the selected input."""
+        button = INPUT_STATE_TO_BUTTON.get(self._tv.input)
+        return self._button_to_source(button) if button else None
+
+    @property
+    def source_list(self) -> list[str] | None:
+        """Return the inputs of the remote."""
+        return self._sources or None
+
+    @property
+    def update_context(self) -> frozenset[tuple[str, str]]:
+        """Return the coordinator keys whose changes this entity follows."""
+        return frozenset({("appliances", self._appliance_id)})
+
+    async def async_turn_on(self) -> None:
+        """Turn the TV on."""
+        await self._press(BUTTON_POWER)
+        self._attr_state = MediaPlayerState.ON
+        self.async_write_ha_state()
+
+    async def async_turn_off(self) -> None:
+        """Turn the TV off."""
+        await self._press(BUTTON_POWER)
+        self._attr_state = MediaPlayerState.OFF
+        self.async_write_ha_state()
+
+    async def async_mute_volume(self, mute: bool) -> None:
+        """Toggle mute."""
+        await self._press(BUTTON_MUTE)
+        self._attr_is_volume_muted = mute
+        self.async_write_ha_state()
+
+    async def async_volume_up(self) -> None:
+        """Turn the volume up one step."""
+        self._queue_volume_step(1)
+
+    async def async_volume_down(self) -> None:
+        """Turn the volume down one step."""
+        self._queue_volume_step(-1)
+
+    async def async_media_next_track(self) -> None:
+        """Go to the next channel."""
+        await self._press(BUTTON_CHANNEL_UP)
+
+    async def async_media_previous_track(self) -> None:
+        """Go to the previous channel."""
+        await self._press(BUTTON_CHANNEL_DOWN)
+
+    async def async_select_source(self, source: str) -> None:
+        """Select an input."""
+        button = f"{INPUT_BUTTON_PREFIX}{source}"
+        if button not in self._buttons:
+            raise HomeAssistantError(f"{self._name} has no input {source}")
+        await self._press(button)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._update_callback, self.update_context
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop volume steps that have not been sent yet."""
+        if self._volume_timer is not None:
+            self._volume_timer.cancel()
+            self._volume_timer = None
+
+    @callback
+    def _update_callback(self) -> None:
+        appliance = self._coordinator.get_appliance(self._appliance_id)
+        if appliance is None:
+            self._async_remove_if_gone()
+            return
+        if appliance.tv is None:
+            return
+        if appliance.tv.buttons != self._buttons:
+            self._set_buttons(appliance.tv.buttons)
+        self._tv = appliance.tv
+        self.async_write_ha_state()
+
+    @callback
+    def _queue_volume_step(self, step: int) -> None:
+        """Add a volume step to the pending burst and restart its window."""
+        self._volume_steps = max(
+            -MAX_VOLUME_BURST, min(self._volume_steps + step, MAX_VOLUME_BURST)
+        )
+        if self._volume_timer is not None:
+            self._volume_timer.cancel()
+        self._volume_timer = self.hass.loop.call_later(
+            self._coordinator.command_debounce, self._flush_volume
+        )
+
+    @callback
+    def _flush_volume(self) -> None:
+        """Hand the net volume steps over to be sent."""
+        self._volume_timer = None
+        steps, self._volume_steps = self._volume_steps, 0
+        if steps:
+            self.hass.async_create_task(self._async_send_volume_burst(steps))
+
+    async def _async_send_volume_burst(self, steps: int) -> None:
+        """Press volume up or down once per net step, one burst at a time."""
+        button = BUTTON_VOLUME_UP if steps > 0 else BUTTON_VOLUME_DOWN
+        async with self._volume_lock:
+            _LOGGER.debug(
+                "Pressing %s %d time(s) on %s", button, abs(steps), self._name
+            )
+            for _ in range(abs(steps)):
+                try:
+                    await self._press(button)
+                except HomeAssistantError as err:
+                    _LOGGER.warning(err)
+                    return
+
+    async def _press(self, button: str) -> None:
+        try:
+            response = await self._coordinator.async_press_button(
+                f"/appliances/{self._appliance_id}/tv", button
+            )
+        except APIError as err:
+            raise HomeAssistantError(
+                f"Failed to press {button} on {self._name}: {err}"
+            ) from err
+        if isinstance(response, dict):
+            self._tv = Tv(
+                input=response.get("input", self._tv.input), buttons=self._buttons
+            )
+            self.async_write_ha_state()
+
+    def _set_buttons(self, buttons: tuple[str, ...]) -> None:
+        """Cache the remote's buttons and the features derived from them."""
+        self._buttons = buttons
+        self._sources = [
+            self._button_to_source(button)
+            for button in buttons
+            if button.startswith(INPUT_BUTTON_PREFIX)
+        ]
+        features = MediaPlayerEntityFeature(0)
+        for button in buttons:
+            features |= BUTTON_FEATURES.get(button, MediaPlayerEntityFeature(0))
+        if self._sources:
+            features |= MediaPlayerEntityFeature.SELECT_SOURCE
+        self._attr_supported_features = features
+
+    @staticmethod
+    def _button_to_source(button: str) -> str:
+        return button.removeprefix(INPUT_BUTTON_PREFIX)
@@ -0,0 +1,313 @@
+"""Typed models for Nature Remo API payloads.
+
+Payloads are parsed into these once per refresh by the coordinator, so
+entities read plain attributes instead of walking raw JSON.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from .echonetlite import SmartMeterReading, decode
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _float_or_none(value: Any) -> float | None:
+    """Convert an api value to float, treating blanks as missing."""
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class SensorEvent:
+    """A sensor reading from a device's newest_events."""
+
+    val: float
+    created_at: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SensorEvent:
+        """Parse a sensor event."""
+        return cls(val=float(data["val"]), created_at=data.get("created_at", ""))
+
+
+@dataclass(slots=True, frozen=True)
+class Device:
+    """A Nature Remo device (the IR hub itself)."""
+
+    id: str
+    name: str
+    serial_number: str = ""
+    firmware_version: str = ""
+    mac_address: str = ""
+    newest_events: dict[str, SensorEvent] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Device:
+        """Parse a device."""
+        events = {}
+        for key, event in (data.get("newest_events") or {}).items():
+            try:
+                events[key] = SensorEvent.from_dict(event)
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.debug("Ignoring malformed %s event: %s", key, event)
+        return cls(
+            id=data["id"],
+            name=data.get("name", ""),
+            serial_number=data.get("serial_number", ""),
+            firmware_version=data.get("firmware_version", ""),
+            mac_address=data.get("mac_address", ""),
+            newest_events=events,
+        )
+
+    @property
+    def temperature(self) -> float | None:
+        """Return the latest temperature reading."""
+        if event := self.newest_events.get("te"):
+            return event.val
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class AirconModeRange:
+    """Temperatures, fan volumes and directions available in one mode."""
+
+    temp: tuple[float, ...]
+    vol: tuple[str, ...]
+    dir: tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AirconModeRange:
+        """Parse a mode range."""
+        return cls(
+            temp=tuple(map(float, filter(None, data.get("temp") or ()))),
+            vol=tuple(data.get("vol") or ()),
+            dir=tuple(data.get("dir") or ()),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AirconRange:
+    """Modes supported by an aircon."""
+
+    modes: dict[str, AirconModeRange]
+    fixed_buttons: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AirconRange:
+        """Parse an aircon range."""
+        return cls(
+            modes={
+                mode: AirconModeRange.from_dict(mode_range)
+                for mode, mode_range in data["modes"].items()
+            },
+            fixed_buttons=tuple(data.get("fixedButtons") or ()),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AirconSettings:
+    """Current aircon settings.
+
+    temp keeps the api's string form, which is what it expects back.
+    """
+
+    temp: str
+    mode: str
+    vol: str | None
+    dir: str | None
+    button: str
+    updated_at: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AirconSettings:
+        """Parse aircon settings."""
+        return cls(
+            temp=data.get("temp", ""),
+            mode=data["mode"],
+            vol=data.get("vol") or None,
+            dir=data.get("dir") or None,
+            button=data.get("button", ""),
+            updated_at=data.get("updated_at", ""),
+        )
+
+    @property
+    def temperature(self) -> float | None:
+        """Return the target temperature."""
+        return _float_or_none(self.temp)
+
+
+@dataclass(slots=True, frozen=True)
+class EchonetLiteProperty:
+    """A raw ECHONET Lite property reported by a smart meter."""
+
+    epc: int
+    val: str
+    name: str = ""
+    updated_at: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EchonetLiteProperty:
+        """Parse a property."""
+        return cls(
+            epc=int(data["epc"]),
+            val=str(data["val"]),
+            name=data.get("name", ""),
+            updated_at=data.get("updated_at", ""),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SmartMeter:
+    """A Nature Remo E smart meter."""
+
+    echonetlite_properties: tuple[EchonetLiteProperty, ...]
+    reading: SmartMeterReading
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SmartMeter:
+        """Parse a smart meter and decode its readings."""
+        properties = tuple(
+            EchonetLiteProperty.from_dict(prop)
+            for prop in data.get("echonetlite_properties") or ()
+        )
+        return cls(
+            echonetlite_properties=properties,
+            reading=decode((prop.epc, prop.val) for prop in properties),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class LightState:
+    """Current state of a light, as last set through the Remo."""
+
+    power: str
+    brightness: str = ""
+    last_button: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LightState:
+        """Parse a light state."""
+        return cls(
+            power=data.get("power", ""),
+            brightness=data.get("brightness", ""),
+            last_button=data.get("last_button", ""),
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the light is on."""
+        return self.power == "on"
+
+
+@dataclass(slots=True, frozen=True)
+class Light:
+    """A light and the buttons of its remote."""
+
+    state: LightState
+    buttons: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Light:
+        """Parse a light."""
+        return cls(
+            state=LightState.from_dict(data.get("state") or {}),
+            buttons=tuple(button["name"] for button in data.get("buttons") or ()),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Tv:
+    """A TV, its selected input and the buttons of its remote."""
+
+    input: str = ""
+    buttons: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Tv:
+        """Parse a TV."""
+        return cls(
+            input=(data.get("state") or {}).get("input", ""),
+            buttons=tuple(button["name"] for button in data.get("buttons") or ()),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Signal:
+    """An IR signal learned for an appliance."""
+
+    id: str
+    name: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Signal:
+        """Parse a signal."""
+        return cls(id=data["id"], name=data.get("name", ""))
+
+
+@dataclass(slots=True, frozen=True)
+class Appliance:
+    """An appliance controlled through a Nature Remo device."""
+
+    id: str
+    type: str
+    nickname: str
+    device: Device
+    aircon: AirconRange | None = None
+    settings: AirconSettings | None = None
+    smart_meter: SmartMeter | None = None
+    light: Light | None = None
+    tv: Tv | None = None
+    signals: tuple[Signal, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Appliance:
+        """Parse an appliance."""
+        aircon = data.get("aircon")
+        settings = data.get("settings")
+        smart_meter = data.get("smart_meter")
+        light = data.get("light")
+        tv = data.get("tv")
+        return cls(
+            id=data["id"],
+            type=data["type"],
+            nickname=data.get("nickname", ""),
+            device=Device.from_dict(data["device"]),
+            aircon=AirconRange.from_dict(aircon["range"]) if aircon else None,
+            settings=AirconSettings.from_dict(settings) if settings else None,
+            smart_meter=SmartMeter.from_dict(smart_meter) if smart_meter else None,
+            light=Light.from_dict(light) if light else None,
+            tv=Tv.from_dict(tv) if tv else None,
+            signals=tuple(
+                Signal.from_dict(signal) for signal in data.get("signals") or ()
+            ),
+        )
+
+
+def parse_appliances(raw: dict[str, dict[str, Any]]) -> dict[str, Appliance]:
+    """Parse appliances keyed by id, skipping malformed entries."""
+    appliances = {}
+    for appliance_id, data in raw.items():
+        try:
+            appliances[appliance_id] = Appliance.from_dict(data)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring malformed appliance %s: %r", appliance_id, err)
+    return appliances
+
+
+def parse_devices(raw: dict[str, dict[str, Any]]) -> dict[str, Device]:
+    """Parse devices keyed by id, skipping malformed entries."""
+    devices = {}
+    for device_id, data in raw.items():
+        try:
+            devices[device_id] = Device.from_dict(data)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring malformed device %s: %r", device_id, err)
+    return devices
@@ -1,58 +1,504 @@
 """A simple Nature Remo API Client."""
 
+import asyncio
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum, StrEnum
+import hashlib
+import json
 import logging
+import random
+import time
+from typing import Any
 
-import requests
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# orjson decodes straight from bytes and is several times faster than the
+# stdlib parser on the appliance list; fall back to json when unavailable.
+json_loads: Callable[[bytes], Any] = orjson.loads if orjson else json.loads
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+DEFAULT_POOL_SIZE = 4
+KEEPALIVE_TIMEOUT = 75
+
+# Background polls are deferred once the remaining budget drops to this
+# many requests, keeping the rest for user commands.
+POLL_RESERVE = 5
+
+# Transient failures are retried up to this many attempts in total, waiting
+# a random ("full jitter") delay of up to BACKOFF_BASE * 2 ** attempt.
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 5.0
+
+# The circuit opens after this many consecutive transient failures and
+# fails fast for BREAKER_COOLDOWN seconds before letting a trial through.
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60
+
+
+class Priority(IntEnum):
+    """Request priority, lower is more urgent."""
+
+    COMMAND = 0
+    POLL = 1
+
+
+@dataclass
+class RateLimitBudget:
+    """Rate limit budget as last reported by the X-Rate-Limit headers."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset: float | None = None
+
+    @property
+    def seconds_until_reset(self) -> float:
+        """Return the number of seconds until the budget resets."""
+        if self.reset is None:
+            return 0.0
+        return max(self.reset - time.time(), 0.0)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while the cloud keeps failing.
+
+    Consecutive transient failures open the circuit. Once the cooldown has
+    passed a single trial request is let through (half open), and its
+    outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN
+    ) -> None:
+        """Init the breaker."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._opened_at = 0.0
+
+    def check(self) -> None:
+        """Raise if requests should not be attempted right now."""
+        if self.state is CircuitState.CLOSED:
+            return
+        remaining = self._opened_at + self._cooldown - time.monotonic()
+        if self.state is CircuitState.OPEN and remaining <= 0:
+            self.state = CircuitState.HALF_OPEN
+            return
+        raise APICircuitOpenError(max(remaining, 0.0))
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+
+    def abort_trial(self) -> None:
+        """Re-open the circuit if a trial ended without an answer.
+
+        E.g. when the trial was refused by the rate limit scheduler or
+        cancelled. The cooldown has already passed, so the next request is
+        let through as a new trial.
+        """
+        if self.state is CircuitState.HALF_OPEN:
+            self.state = CircuitState.OPEN
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit if needed."""
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= self._threshold:
+            if self.state is not CircuitState.OPEN:
+                _LOGGER.warning(
+                    "Nature Remo API failing, pausing requests for %ss", self._cooldown
+                )
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+
+class RateLimitScheduler:
+    """Track the rate limit budget and schedule requests against it.
+
+    Commands always go ahead of polls: a poll waits until no command is
+    pending, and is refused while the budget is at or below the reserve.
+    """
+
+    def __init__(self, poll_reserve: int = POLL_RESERVE) -> None:
+        """Init the scheduler."""
+        self.budget = RateLimitBudget()
+        self._poll_reserve = poll_reserve
+        self._pending_commands = 0
+        self._commands_idle = asyncio.Event()
+        self._commands_idle.set()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold a request slot for the given priority."""
+        if priority is Priority.COMMAND:
+            self._pending_commands += 1
+            self._commands_idle.clear()
+            try:
+                self._reserve(0)
+                yield
+            finally:
+                self._pending_commands -= 1
+                if not self._pending_commands:
+                    self._commands_idle.set()
+        else:
+            await self._commands_idle.wait()
+            self._reserve(self._poll_reserve)
+            yield
+
+    def _reserve(self, reserve: int) -> None:
+        """Take one request from the budget or raise if it is exhausted."""
+        budget = self.budget
+        if budget.remaining is None:
+            return
+        if budget.remaining <= reserve and budget.seconds_until_reset > 0:
+            raise APIRateLimitError(budget.seconds_until_reset)
+        # Count the request straight away so concurrent requests see it
+        # before the response headers arrive.
+        budget.remaining = max(budget.remaining - 1, 0)
+
+    def update(self, headers) -> None:
+        """Update the budget from response headers."""
+        try:
+            if (limit := headers.get("X-Rate-Limit-Limit")) is not None:
+                self.budget.limit = int(limit)
+            if (remaining := headers.get("X-Rate-Limit-Remaining")) is not None:
+                self.budget.remaining = int(remaining)
+            if (reset := headers.get("X-Rate-Limit-Reset")) is not None:
+                self.budget.reset = float(reset)
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed rate limit headers: %s", headers)
+
+    def exhausted(self, retry_after: float | None = None) -> None:
+        """Mark the budget as exhausted after a 429 response."""
+        self.budget.remaining = 0
+        if retry_after is not None:
+            self.budget.reset = time.time() + retry_after
+
 
 class NatureRemoAPI:
-    """Nature Remo API client."""
+    """Nature Remo API client.
 
-    def __init__(self, host, access_token) -> None:
+    If no session is passed in, the client owns a pooled session whose
+    keep-alive connections (and their TLS state) are reused across polls.
+    Call close() when done with it.
+    """
+
+    def __init__(
+        self,
+        host,
+        access_token,
+        session: aiohttp.ClientSession | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        loads: Callable[[bytes], Any] = json_loads,
+    ) -> None:
         """Init API client."""
         self._access_token = access_token
         self._host = host
+        self._session = session
+        self._owns_session = session is None
+        self._closed = False
+        self._pool_size = pool_size
+        self._loads = loads
+        self.scheduler = RateLimitScheduler()
+        self.breaker = CircuitBreaker()
+        self._cache: dict[str, _CacheEntry] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
-    def authenticate_check(self) -> bool:
-        """Make basic check for authorization."""
-        _LOGGER.debug("Trying to fetch appliance and device list from API")
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-        response = requests.get(f"{self._host}/appliances", headers=headers, timeout=10)
+    @property
+    def rate_limit(self) -> RateLimitBudget:
+        """Return the current rate limit budget."""
+        return self.scheduler.budget
 
-        if response.status_code != 200:
-            return False
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Return response cache hit and miss counts."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating the owned pool on first use.
+
+        Once closed the client stays closed, so late commands or reconciles
+        fail instead of opening a pool nobody would close.
+        """
+        if self._closed:
+            raise APIFatalError("Nature Remo API client is closed")
+        if self._owns_session and (self._session is None or self._session.closed):
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
 
-        response_json = response.json()
+    async def close(self) -> None:
+        """Close the owned session and its pooled connections."""
+        self._closed = True
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
 
-        appliances = {x["id"]: x for x in response_json}
+    @property
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self._access_token}"}
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        data=None,
+        priority: Priority = Priority.POLL,
+        headers: dict[str, str] | None = None,
+        attempts: int = MAX_ATTEMPTS,
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        """Send a request, retrying transient failures with jittered backoff."""
+        attempt = 0
+        while True:
+            self.breaker.check()
+            try:
+                return await self._send_once(method, path, data, priority, headers)
+            except APIConnectionError as err:
+                self.breaker.record_failure()
+                attempt += 1
+                if attempt >= attempts or self.breaker.state is CircuitState.OPEN:
+                    raise
+                delay = random.uniform(
+                    0, min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX)
+                )
+                _LOGGER.debug("Retrying %s %s in %.1fs: %s", method, path, delay, err)
+            finally:
+                # Never leave the circuit half open, whatever ended the trial.
+                self.breaker.abort_trial()
+            await asyncio.sleep(delay)
+
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        data,
+        priority: Priority,
+        headers: dict[str, str] | None,
+    ) -> tuple[int, Mapping[str, str], bytes]:
+        """Send a request once and return its status, headers and raw body."""
+        try:
+            async with (
+                self.scheduler.slot(priority),
+                self._get_session().request(
+                    method,
+                    f"{self._host}{path}",
+                    data=data,
+                    headers=self._headers | (headers or {}),
+                    timeout=REQUEST_TIMEOUT,
+                ) as response,
+            ):
+                self.scheduler.update(response.headers)
+                if response.status < 500:
+                    # Any answer short of a server error, a 429 or 4xx too,
+                    # shows the server is up.
+                    self.breaker.record_success()
+                if response.status == 429:
+                    retry_after = _parse_retry_after(response.headers)
+                    self.scheduler.exhausted(retry_after)
+                    raise APIRateLimitError(self.rate_limit.seconds_until_reset)
+                if response.status in (401, 403):
+                    raise APIAuthError(f"Unauthorized request to {path}")
+                if response.status >= 500:
+                    raise APIConnectionError(
+                        f"Server error {response.status} requesting {path}"
+                    )
+                if response.status >= 400:
+                    raise APIFatalError(
+                        f"Request to {path} rejected with {response.status}"
+                    )
+                return response.status, response.headers, await response.read()
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise APIConnectionError(f"Error requesting {path}: {err}") from err
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data=None,
+        priority: Priority = Priority.POLL,
+        attempts: int = MAX_ATTEMPTS,
+    ) -> Any:
+        """Send a request and return the decoded JSON body."""
+        _, _, body = await self._send(method, path, data, priority, attempts=attempts)
+        return self._decode(path, body)
+
+    def _decode(self, path: str, body: bytes) -> Any:
+        """Decode a response body."""
+        try:
+            return self._loads(body)
+        except ValueError as err:
+            raise APIFatalError(f"Invalid JSON from {path}: {err}") from err
+
+    async def _get_cached(
+        self, path: str, transform: Callable[[Any], Any] | None = None
+    ) -> Any:
+        """GET a path, reusing the cached result when it has not changed.
+
+        The request is made conditional on the validators of the previous
+        response. On a 304, or a body identical to the previous one, the
+        previously decoded (and transformed) object is returned as is.
+        """
+        cached = self._cache.get(path)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        status, response_headers, body = await self._send("GET", path, headers=headers)
+        if cached is not None and status == 304:
+            self.cache_hits += 1
+            return cached.value
+
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if cached is not None and cached.digest == digest:
+            self.cache_hits += 1
+            return cached.value
+
+        self.cache_misses += 1
+        value = self._decode(path, body)
+        if transform is not None:
+            value = transform(value)
+        self._cache[path] = _CacheEntry(
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+            digest=digest,
+            value=value,
+        )
+        return value
+
+    async def authenticate_check(self) -> bool:
+        """Make basic check for authorization."""
+        _LOGGER.debug("Trying to fetch appliance and device list from API")
+        try:
+            await self._request("GET", "/appliances")
+        except APIAuthError:
+            return False
         return True
 
-    def get(self):
+    async def get(self):
         """Get appliance and device list."""
         _LOGGER.debug("Trying to fetch appliance and device list from API")
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-        response = requests.get(f"{self._host}/appliances", headers=headers, timeout=10)
-        appliances = {x["id"]: x for x in response.json()}
-
-        response = requests.get(f"{self._host}/devices", headers=headers, timeout=10)
-        devices = {x["id"]: x for x in response.json()}
+        # Both endpoints are independent, so fetch them concurrently over the
+        # same session rather than paying two sequential round trips.
+        appliances, devices = await asyncio.gather(
+            self.get_appliances(), self.get_devices()
+        )
         return {"appliances": appliances, "devices": devices}
 
-    def post(self, path, data):
-        """Post any request."""
+    async def get_appliances(self) -> dict[str, Any]:
+        """Get appliances keyed by id.
+
+        The same object is returned for as long as the payload is unchanged.
+        """
+        return await self._get_cached("/appliances", _index_by_id)
+
+    async def get_devices(self) -> dict[str, Any]:
+        """Get devices keyed by id.
+
+        The same object is returned for as long as the payload is unchanged.
+        """
+        return await self._get_cached("/devices", _index_by_id)
+
+    async def post(
+        self,
+        path,
+        data,
+        priority: Priority = Priority.COMMAND,
+        idempotent: bool = True,
+    ):
+        """Post any request.
+
+        Only idempotent requests, e.g. setting absolute values, are retried;
+        a retried toggle could be applied twice.
+        """
         _LOGGER.debug("Trying to request post:%s, data:%s", path, data)
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-        response = requests.post(
-            f"{self._host}{path}", data=data, headers=headers, timeout=10
+        return await self._request(
+            "POST", path, data, priority, attempts=MAX_ATTEMPTS if idempotent else 1
         )
-        return response.json()
 
 
-class APIAuthError(Exception):
+@dataclass(slots=True)
+class _CacheEntry:
+    """Validators and decoded result of the last response for a path."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    value: Any
+
+
+def _index_by_id(items: list[dict[str, Any]]) -> dict[str, Any]:
+    """Key a list of api objects by id."""
+    return {x["id"]: x for x in items}
+
+
+def _parse_retry_after(headers) -> float | None:
+    """Return the Retry-After header in seconds, if present."""
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class APIError(Exception):
+    """Base exception class for api errors."""
+
+
+class APIAuthError(APIError):
     """Exception class for auth error."""
 
 
-class APIConnectionError(Exception):
-    """Exception class for connection error."""
+class APIConnectionError(APIError):
+    """Exception class for connection error.
+
+    These are transient: timeouts, network failures and server errors.
+    """
+
+
+class APICircuitOpenError(APIConnectionError):
+    """Exception class for requests refused while the circuit is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Init the error."""
+        super().__init__(f"API unavailable, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class APIFatalError(APIError):
+    """Exception class for requests that will not succeed if retried."""
+
+
+class APIRateLimitError(APIError):
+    """Exception class for an exhausted rate limit."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Init the error."""
+        super().__init__(f"Rate limit exhausted, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
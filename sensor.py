@@ -0,0 +1,248 @@
+"""Sensor setup for Nature Remo."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    LIGHT_LUX,
+    PERCENTAGE,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
+
+from .base import NatureRemoBase, NatureRemoBaseEntity
+from .const import DOMAIN
+from .coordinator import NatureRemoCoordinator
+from .echonetlite import SmartMeterReading
+from .models import Appliance, Device, SensorEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NatureRemoSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor read from a device's newest_events."""
+
+    event: str
+    value_fn: Callable[[SensorEvent], StateType | datetime]
+
+
+SENSORS: tuple[NatureRemoSensorEntityDescription, ...] = (
+    NatureRemoSensorEntityDescription(
+        key="temperature",
+        event="te",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda event: event.val,
+    ),
+    NatureRemoSensorEntityDescription(
+        key="humidity",
+        event="hu",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda event: event.val,
+    ),
+    NatureRemoSensorEntityDescription(
+        key="illuminance",
+        event="il",
+        device_class=SensorDeviceClass.ILLUMINANCE,
+        native_unit_of_measurement=LIGHT_LUX,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda event: event.val,
+    ),
+    # Motion events carry no meaningful value, only when motion was seen.
+    NatureRemoSensorEntityDescription(
+        key="last_motion",
+        event="mo",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda event: dt_util.parse_datetime(event.created_at),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NatureRemoEnergySensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor read from a smart meter's decoded reading."""
+
+    value_fn: Callable[[SmartMeterReading], StateType]
+
+
+# Compatible with the energy dashboard: power as a measurement, energy as
+# total_increasing so counter wrap-arounds are treated as meter resets.
+ENERGY_SENSORS: tuple[NatureRemoEnergySensorEntityDescription, ...] = (
+    NatureRemoEnergySensorEntityDescription(
+        key="power",
+        name="Power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda reading: reading.power,
+    ),
+    NatureRemoEnergySensorEntityDescription(
+        key="energy_imported",
+        name="Energy Imported",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda reading: reading.energy_imported,
+    ),
+    NatureRemoEnergySensorEntityDescription(
+        key="energy_exported",
+        name="Energy Exported",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda reading: reading.energy_exported,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Sensors."""
+    # This gets the data update coordinator from hass.data as specified in your __init__.py
+    coordinator: NatureRemoCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ].coordinator
+
+    # ----------------------------------------------------------------------------
+    # Sensors are built from the newest_events already included in the /devices
+    # payload, so they cost no extra api requests. Only the events a device
+    # actually reports get an entity.
+    # ----------------------------------------------------------------------------
+    async_add_entities(
+        NatureRemoSensor(coordinator, device, description)
+        for device in coordinator.data["devices"].values()
+        for description in SENSORS
+        if description.event in device.newest_events
+    )
+
+    # Nature Remo E smart meters, one sensor per value the meter reports,
+    # including meters that appear in a later refresh.
+    @callback
+    def _async_add_smart_meters(appliances: list[Appliance]) -> None:
+        async_add_entities(
+            NatureRemoEnergySensor(coordinator, appliance, description)
+            for appliance in appliances
+            if appliance.smart_meter is not None
+            for description in ENERGY_SENSORS
+            if description.value_fn(appliance.smart_meter.reading) is not None
+        )
+
+    config_entry.async_on_unload(
+        coordinator.async_track_appliances("EL_SMART_METER", _async_add_smart_meters)
+    )
+
+
+class NatureRemoSensor(NatureRemoBaseEntity, SensorEntity):
+    """Implementation of a Nature Remo device sensor."""
+
+    entity_description: NatureRemoSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: NatureRemoCoordinator,
+        device: Device,
+        description: NatureRemoSensorEntityDescription,
+    ) -> None:
+        """Initialise sensor."""
+        super().__init__(coordinator, device, description.key)
+        self.entity_description = description
+        self._written = self._state_key()
+
+    @property
+    def _event(self) -> SensorEvent | None:
+        return self.device.newest_events.get(self.entity_description.event)
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the state of the sensor."""
+        if (event := self._event) is None:
+            return None
+        return self.entity_description.value_fn(event)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the event is newer or availability changed."""
+        if device := self.coordinator.get_device(self.device_id):
+            self.device = device
+        if (state_key := self._state_key()) == self._written:
+            self.coordinator.skipped_updates += 1
+            return
+        self._written = state_key
+        self.async_write_ha_state()
+
+    def _state_key(self) -> tuple[str | None, bool]:
+        event = self._event
+        return (event.created_at if event else None, self.available)
+
+
+class NatureRemoEnergySensor(NatureRemoBase, SensorEntity):
+    """Implementation of a Nature Remo E smart meter sensor."""
+
+    entity_description: NatureRemoEnergySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: NatureRemoCoordinator,
+        appliance: Appliance,
+        description: NatureRemoEnergySensorEntityDescription,
+    ) -> None:
+        """Initialise sensor."""
+        super().__init__(coordinator, appliance)
+        self.entity_description = description
+        self._name = f"{self._name} {description.name}"
+        self._attr_native_value = description.value_fn(appliance.smart_meter.reading)
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID."""
+        return f"{self._appliance_id}-{self.entity_description.key}"
+
+    @property
+    def update_context(self) -> frozenset[tuple[str, str]]:
+        """Return the coordinator keys whose changes this entity follows."""
+        return frozenset({("appliances", self._appliance_id)})
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._update_callback, self.update_context
+            )
+        )
+
+    @callback
+    def _update_callback(self) -> None:
+        """Write state only when the decoded value changed."""
+        appliance = self._coordinator.get_appliance(self._appliance_id)
+        if appliance is None:
+            self._async_remove_if_gone()
+            return
+        if appliance.smart_meter is None:
+            return
+        value = self.entity_description.value_fn(appliance.smart_meter.reading)
+        if value == self._attr_native_value:
+            self._coordinator.skipped_updates += 1
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
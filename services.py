@@ -0,0 +1,91 @@
+"""Global services for the Nature Remo integration."""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import DOMAIN, SEND_IR_SERVICE_NAME
+from .nature_remo_api import APIError
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_MESSAGE = "message"
+ATTR_SIGNAL_ID = "signal_id"
+
+SEND_IR_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DEVICE_ID): cv.string,
+            vol.Optional(ATTR_MESSAGE): vol.Schema(
+                {vol.Required("data"): [int]}, extra=vol.ALLOW_EXTRA
+            ),
+            vol.Optional(ATTR_SIGNAL_ID): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_MESSAGE, ATTR_SIGNAL_ID),
+)
+
+
+class NatureRemoServicesSetup:
+    """Class to handle Integration Services."""
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialise services."""
+        self.hass = hass
+        self.config_entry = config_entry
+
+        self.setup_services()
+
+    def setup_services(self):
+        """Initialise the services in Hass.
+
+        They serve every loaded entry, so are only registered by the first
+        one and removed once the last one unloads.
+        """
+        if self.hass.services.has_service(DOMAIN, SEND_IR_SERVICE_NAME):
+            return
+        self.hass.services.async_register(
+            DOMAIN, SEND_IR_SERVICE_NAME, self.send_ir, schema=SEND_IR_SCHEMA
+        )
+
+    async def send_ir(self, service_call: ServiceCall) -> None:
+        """Send an IR signal through a Remo device.
+
+        A raw message goes over the LAN when the device has a local host,
+        otherwise (or if that fails) the learned signal is sent via the cloud.
+        """
+        device_entry = dr.async_get(self.hass).async_get(
+            service_call.data[ATTR_DEVICE_ID]
+        )
+        remo_ids = {
+            identifier
+            for domain, identifier in (device_entry.identifiers if device_entry else ())
+            if domain == DOMAIN
+        }
+
+        for runtime_data in self.hass.data[DOMAIN].values():
+            coordinator = runtime_data.coordinator
+            for device_id in remo_ids:
+                if coordinator.get_device(device_id) is None:
+                    continue
+                try:
+                    await coordinator.async_send_ir(
+                        device_id,
+                        service_call.data.get(ATTR_MESSAGE),
+                        service_call.data.get(ATTR_SIGNAL_ID),
+                    )
+                except APIError as err:
+                    raise HomeAssistantError(f"Failed to send IR: {err}") from err
+                return
+
+        raise ServiceValidationError(
+            f"{service_call.data[ATTR_DEVICE_ID]} is not a Nature Remo device"
+        )
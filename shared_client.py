@@ -0,0 +1,150 @@
+"""Registry of API clients shared by config entries using the same token.
+
+Entries for the same account share one client, so they also share its
+connection pool, rate limit budget and response cache. Concurrent or
+back-to-back polls from several entries are answered by one request, and
+every poll's result is handed to the other entries as their own update, so
+they poll on one schedule instead of each spending the shared budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import DOMAIN, MIN_SCAN_INTERVAL
+from .nature_remo_api import NatureRemoAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CLIENTS = f"{DOMAIN}_clients"
+
+# Poll results younger than this are handed to other entries as they are.
+SHARED_RESULT_MAX_AGE = MIN_SCAN_INTERVAL / 2
+
+
+class SharedClient:
+    """An api client shared by every entry of one account."""
+
+    def __init__(self, key: tuple[str, str], api: NatureRemoAPI) -> None:
+        """Init the shared client."""
+        self.key = key
+        self.api = api
+        self.refs = 0
+        self.cancel_stop_listener: CALLBACK_TYPE | None = None
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._results: dict[str, tuple[float, Any]] = {}
+        # Callbacks handed each new result by name ("all" | "devices"), and
+        # the subscribers waiting on the fetch in flight, which get the
+        # result as their return value instead.
+        self._subscribers: dict[object, Callable[[str, Any], None]] = {}
+        self._waiting: dict[str, set[object]] = {}
+
+    async def get(self, requester: object | None = None) -> dict[str, Any]:
+        """Get appliance and device list, shared between entries."""
+        return await self._async_fetch("all", self.api.get, requester)
+
+    async def get_devices(self, requester: object | None = None) -> dict[str, Any]:
+        """Get devices keyed by id, shared between entries."""
+        return await self._async_fetch("devices", self.api.get_devices, requester)
+
+    @callback
+    def async_subscribe(
+        self, subscriber: object, on_result: Callable[[str, Any], None]
+    ) -> CALLBACK_TYPE:
+        """Hand a subscriber the results of fetches made by the others."""
+        self._subscribers[subscriber] = on_result
+
+        @callback
+        def _unsubscribe() -> None:
+            self._subscribers.pop(subscriber, None)
+
+        return _unsubscribe
+
+    @callback
+    def invalidate(self) -> None:
+        """Forget recent results, e.g. after a command changed the state."""
+        self._results.clear()
+
+    async def _async_fetch(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[Any]],
+        requester: object | None,
+    ) -> Any:
+        """Run a fetch once for all concurrent callers.
+
+        A result younger than SHARED_RESULT_MAX_AGE is returned without a
+        request, and callers arriving while a fetch is in flight wait on it.
+        Subscribers that did not ask for it are handed the result once done.
+        """
+        if (result := self._results.get(name)) is not None:
+            fetched_at, value = result
+            if time.monotonic() - fetched_at < SHARED_RESULT_MAX_AGE:
+                return value
+
+        if (future := self._inflight.get(name)) is None:
+            future = self._inflight[name] = asyncio.ensure_future(fetch())
+            future.add_done_callback(lambda done: self._store(name, done))
+        self._waiting.setdefault(name, set()).add(requester)
+        # Shield so one caller being cancelled does not cancel the others.
+        return await asyncio.shield(future)
+
+    @callback
+    def _store(self, name: str, future: asyncio.Future[Any]) -> None:
+        """Keep a successful result, and hand it to the other entries."""
+        self._inflight.pop(name, None)
+        waiting = self._waiting.pop(name, set())
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        self._results[name] = (time.monotonic(), result)
+        for subscriber, on_result in list(self._subscribers.items()):
+            if subscriber not in waiting:
+                on_result(name, result)
+
+
+@callback
+def async_acquire_client(
+    hass: HomeAssistant, host: str, access_token: str, pool_size: int
+) -> SharedClient:
+    """Get the shared client for an account, creating it if needed."""
+    clients: dict[tuple[str, str], SharedClient] = hass.data.setdefault(
+        DATA_CLIENTS, {}
+    )
+    key = (host, access_token)
+    if (client := clients.get(key)) is None:
+        client = clients[key] = SharedClient(
+            key,
+            NatureRemoAPI(host=host, access_token=access_token, pool_size=pool_size),
+        )
+
+        async def _async_close_on_stop(event: Event) -> None:
+            # Entries are not unloaded on shutdown, so close the pool here.
+            client.cancel_stop_listener = None
+            await client.api.close()
+
+        client.cancel_stop_listener = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_close_on_stop
+        )
+    client.refs += 1
+    _LOGGER.debug("Shared client for %s now has %d user(s)", host, client.refs)
+    return client
+
+
+async def async_release_client(hass: HomeAssistant, client: SharedClient) -> None:
+    """Drop a reference to a shared client, closing it with the last one."""
+    client.refs -= 1
+    if client.refs > 0:
+        return
+    hass.data[DATA_CLIENTS].pop(client.key, None)
+    if client.cancel_stop_listener is not None:
+        client.cancel_stop_listener()
+        client.cancel_stop_listener = None
+    await client.api.close()